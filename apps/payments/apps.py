@@ -0,0 +1,13 @@
+import atexit
+
+from django.apps import AppConfig
+
+
+class PaymentsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.payments'
+
+    def ready(self):
+        from .models import close_http_client
+
+        atexit.register(close_http_client)
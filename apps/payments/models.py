@@ -5,26 +5,122 @@ All payment-related classes in one file for simplicity.
 Demonstrates Liskov Substitution Principle with minimal code.
 """
 
+import asyncio
+import hashlib
+import logging
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional
 
+import httpx
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+STRIPE_CHARGES_URL = "https://api.stripe.com/v1/charges"
+
+# How long a successful charge is remembered, so retries don't charge twice
+IDEMPOTENCY_TIMEOUT = 300
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_loop_lock = threading.Lock()
+
+
+def _get_http_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop that owns the shared HTTP client, running in a daemon thread
+
+    Sync callers (async_to_sync) and async views served under WSGI get a fresh
+    event loop per call, and an AsyncClient cannot be shared across loops. Keeping
+    the client on one long-lived loop lets every caller reuse its connections.
+    """
+    global _http_loop
+    with _http_loop_lock:
+        if _http_loop is None or _http_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="payments-http", daemon=True
+            ).start()
+            _http_loop = loop
+        return _http_loop
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared, connection-pooled HTTP client for processor API calls
+
+    Must only be used on the loop returned by _get_http_loop(); go through
+    http_post() from anywhere else. TCP/TLS connections are kept alive and
+    HTTP/2 multiplexes concurrent charges over them.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+        )
+    return _http_client
+
+
+async def http_post(url: str, **kwargs) -> httpx.Response:
+    """POST through the shared client, awaitable from any event loop"""
+
+    async def post():
+        return await get_http_client().post(url, **kwargs)
+
+    future = asyncio.run_coroutine_threadsafe(post(), _get_http_loop())
+    return await asyncio.wrap_future(future)
+
+
+def close_http_client():
+    """Close the shared HTTP client and stop its loop (registered with atexit)"""
+    global _http_client, _http_loop
+    with _http_loop_lock:
+        client, loop = _http_client, _http_loop
+        _http_client = _http_loop = None
+    if loop is None or loop.is_closed():
+        return
+    if client is not None and not client.is_closed:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def to_cents(amount) -> int:
+    """
+    Convert a dollar amount (str, int, float or Decimal) to integer cents
+
+    Amounts are parsed once at the request boundary and kept as cents afterwards.
+    """
+    return int((Decimal(str(amount)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def format_cents(amount_cents: int) -> str:
+    """Format integer cents as a dollar string, e.g. 1099 -> '10.99'"""
+    return f"{amount_cents / 100:.2f}"
+
+
+@dataclass(slots=True, frozen=True)
 class PaymentResult:
     """
     Standardized payment result that all processors must return
     This ensures LSP compliance - same data structure from all processors
+
+    Results are immutable and hashable, so identical results can be cached.
     """
     success: bool
     transaction_id: str
-    amount: float
+    amount: int  # in cents
     processor_name: str
     error_message: Optional[str] = None
     
     def __str__(self):
         status = "SUCCESS" if self.success else "FAILED"
-        return f"{self.processor_name}: {status} - ${self.amount} (ID: {self.transaction_id})"
+        return f"{self.processor_name}: {status} - ${format_cents(self.amount)} (ID: {self.transaction_id})"
 
 
 class PaymentProcessor(ABC):
@@ -35,12 +131,12 @@ class PaymentProcessor(ABC):
     """
     
     @abstractmethod
-    def process_payment(self, amount: float, payment_token: str) -> PaymentResult:
+    async def aprocess_payment(self, amount_cents: int, payment_token: str) -> PaymentResult:
         """
         Process a payment - ALL processors must implement this exactly the same way
         
         Args:
-            amount: Payment amount in dollars
+            amount_cents: Payment amount in cents
             payment_token: Payment method token
             
         Returns:
@@ -48,6 +144,12 @@ class PaymentProcessor(ABC):
         """
         pass
 
+    def process_payment(self, amount_cents: int, payment_token: str) -> PaymentResult:
+        """
+        Synchronous wrapper around aprocess_payment for sync callers
+        """
+        return async_to_sync(self.aprocess_payment)(amount_cents, payment_token)
+
 
 class StripeProcessor(PaymentProcessor):
     """Stripe implementation following LSP"""
@@ -56,24 +158,29 @@ class StripeProcessor(PaymentProcessor):
         self.api_key = api_key
         self.processor_name = "Stripe"
     
-    def process_payment(self, amount: float, payment_token: str) -> PaymentResult:
+    async def aprocess_payment(self, amount_cents: int, payment_token: str) -> PaymentResult:
         """
         Stripe implementation - same signature as interface
         """
         try:
-            print(f"[STRIPE] Processing ${amount} with token {payment_token}")
+            logger.info("[STRIPE] Processing $%s with token %s", format_cents(amount_cents), payment_token)
             
-            # Simulate Stripe API call
-            stripe_response = {
-                'charge_id': f'ch_stripe_{payment_token}',
-                'status': 'succeeded',
-                'amount': int(amount * 100)  # Stripe uses cents
-            }
+            response = await http_post(
+                STRIPE_CHARGES_URL,
+                auth=(self.api_key, ''),
+                data={
+                    'amount': amount_cents,  # Stripe uses cents natively
+                    'currency': 'usd',
+                    'source': payment_token,
+                },
+            )
+            response.raise_for_status()
+            stripe_response = response.json()
             
             return PaymentResult(
                 success=stripe_response['status'] == 'succeeded',
-                transaction_id=stripe_response['charge_id'],
-                amount=amount,
+                transaction_id=stripe_response['id'],
+                amount=amount_cents,
                 processor_name=self.processor_name
             )
             
@@ -81,7 +188,7 @@ class StripeProcessor(PaymentProcessor):
             return PaymentResult(
                 success=False,
                 transaction_id="",
-                amount=amount,
+                amount=amount_cents,
                 processor_name=self.processor_name,
                 error_message=f"Stripe error: {str(e)}"
             )
@@ -95,25 +202,25 @@ class PayPalProcessor(PaymentProcessor):
         self.client_secret = client_secret
         self.processor_name = "PayPal"
     
-    def process_payment(self, amount: float, payment_token: str) -> PaymentResult:
+    async def aprocess_payment(self, amount_cents: int, payment_token: str) -> PaymentResult:
         """
         PayPal implementation - EXACT same signature as Stripe
         This is what makes them substitutable (LSP compliance)
         """
         try:
-            print(f"[PAYPAL] Processing ${amount} with token {payment_token}")
+            logger.info("[PAYPAL] Processing $%s with token %s", format_cents(amount_cents), payment_token)
             
             # Simulate PayPal API call
             paypal_response = {
                 'payment_id': f'PAY_paypal_{payment_token}',
                 'state': 'approved',
-                'amount': {'total': str(amount), 'currency': 'USD'}
+                'amount': {'total': format_cents(amount_cents), 'currency': 'USD'}
             }
             
             return PaymentResult(
                 success=paypal_response['state'] == 'approved',
                 transaction_id=paypal_response['payment_id'],
-                amount=amount,
+                amount=amount_cents,
                 processor_name=self.processor_name
             )
             
@@ -121,7 +228,7 @@ class PayPalProcessor(PaymentProcessor):
             return PaymentResult(
                 success=False,
                 transaction_id="",
-                amount=amount,
+                amount=amount_cents,
                 processor_name=self.processor_name,
                 error_message=f"PayPal error: {str(e)}"
             )
@@ -137,11 +244,42 @@ class PaymentService:
     def __init__(self, processor: PaymentProcessor):
         self.processor = processor
     
-    def charge_customer(self, amount: float, payment_token: str) -> PaymentResult:
+    def charge_customer(self, amount_cents: int, payment_token: str) -> PaymentResult:
         """
         Process payment using any processor
         
         This method works identically with Stripe, PayPal, or any future processor!
         No if/elif statements needed - perfect LSP compliance.
+
+        Successful results are cached for IDEMPOTENCY_TIMEOUT seconds, so a retry
+        with the same processor, token and amount returns the original result
+        instead of charging again.
+        """
+        key = self._idempotency_key(amount_cents, payment_token)
+        cached = cache.get(key)
+        if cached is not None:
+            return PaymentResult(**cached)
+
+        result = self.processor.process_payment(amount_cents, payment_token)
+        if result.success:
+            cache.set(key, asdict(result), timeout=IDEMPOTENCY_TIMEOUT)
+        return result
+
+    async def acharge_customer(self, amount_cents: int, payment_token: str) -> PaymentResult:
+        """
+        Async variant of charge_customer, awaitable alongside other I/O
         """
-        return self.processor.process_payment(amount, payment_token)
\ No newline at end of file
+        key = self._idempotency_key(amount_cents, payment_token)
+        cached = await cache.aget(key)
+        if cached is not None:
+            return PaymentResult(**cached)
+
+        result = await self.processor.aprocess_payment(amount_cents, payment_token)
+        if result.success:
+            await cache.aset(key, asdict(result), timeout=IDEMPOTENCY_TIMEOUT)
+        return result
+
+    def _idempotency_key(self, amount_cents: int, payment_token: str) -> str:
+        """Cache key for a charge; the token is hashed to keep keys short and safe"""
+        token_hash = hashlib.sha256(payment_token.encode()).hexdigest()
+        return f"pay:{self.processor.processor_name}:{token_hash}:{amount_cents}"
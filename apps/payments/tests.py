@@ -0,0 +1,403 @@
+"""
+Tests for the payment money helpers, processors, service and HTTP client
+
+Processor HTTP calls are served by httpx.MockTransport, so no request
+ever leaves the test process.
+"""
+
+from decimal import Decimal, InvalidOperation
+from unittest import mock
+
+import httpx
+import orjson
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from . import models
+from .models import (
+    PaymentProcessor,
+    PaymentResult,
+    PaymentService,
+    StripeProcessor,
+    close_http_client,
+    format_cents,
+    to_cents,
+)
+
+# Idempotency keys live in process memory, isolated from any shared cache
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+def _stripe_succeeded(request):
+    """MockTransport handler answering like a successful Stripe charge"""
+    return httpx.Response(200, json={"id": "ch_test", "status": "succeeded"})
+
+
+class CentsConversionTest(SimpleTestCase):
+    """Test the dollar <-> integer cents helpers"""
+
+    def test_half_cent_rounds_up(self):
+        """Test that half a cent rounds away from zero, never to even"""
+        self.assertEqual(to_cents("10.005"), 1001)
+        self.assertEqual(to_cents("10.015"), 1002)
+        self.assertEqual(to_cents("0.125"), 13)
+        self.assertEqual(to_cents("10.0049"), 1000)
+
+    def test_input_types(self):
+        """Test that str, int, float and Decimal amounts convert alike"""
+        for amount in ("19.99", 19.99, Decimal("19.99")):
+            with self.subTest(amount=amount):
+                self.assertEqual(to_cents(amount), 1999)
+        self.assertEqual(to_cents(20), 2000)
+        self.assertEqual(to_cents("20"), 2000)
+
+    def test_float_uses_its_shortest_repr(self):
+        """Test that floats convert via str(), not their binary expansion"""
+        # Decimal(10.005) is 10.00499999..., which would round down to 1000
+        self.assertEqual(to_cents(10.005), 1001)
+        self.assertEqual(to_cents(0.1 + 0.2), 30)
+
+    def test_negative_amounts(self):
+        """Test that refunds and credits round symmetrically"""
+        self.assertEqual(to_cents("-10.005"), -1001)
+        self.assertEqual(to_cents(-19.99), -1999)
+        self.assertEqual(format_cents(-1001), "-10.01")
+        self.assertEqual(format_cents(-5), "-0.05")
+
+    def test_invalid_amount_raises(self):
+        """Test that non-numeric input raises instead of charging zero"""
+        with self.assertRaises(InvalidOperation):
+            to_cents("ten dollars")
+
+    def test_format_cents(self):
+        """Test that cents always format with two decimal places"""
+        self.assertEqual(format_cents(0), "0.00")
+        self.assertEqual(format_cents(5), "0.05")
+        self.assertEqual(format_cents(1099), "10.99")
+        self.assertEqual(format_cents(100000), "1000.00")
+
+    def test_round_trip(self):
+        """Test that format_cents output converts back to the same cents"""
+        for amount_cents in [*range(-1000, 1001), 123456789, 99999999999]:
+            with self.subTest(amount_cents=amount_cents):
+                self.assertEqual(to_cents(format_cents(amount_cents)), amount_cents)
+
+
+class CountingProcessor(PaymentProcessor):
+    """Processor that records its calls and succeeds unless told otherwise"""
+
+    def __init__(self, success=True):
+        self.processor_name = "Counting"
+        self.success = success
+        self.calls = []
+
+    async def aprocess_payment(self, amount_cents, payment_token):
+        self.calls.append((amount_cents, payment_token))
+        return PaymentResult(
+            success=self.success,
+            transaction_id=f"txn_{len(self.calls)}" if self.success else "",
+            amount=amount_cents,
+            processor_name=self.processor_name,
+            error_message=None if self.success else "declined",
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PaymentIdempotencyTest(SimpleTestCase):
+    """Test that PaymentService remembers successful charges"""
+
+    def setUp(self):
+        cache.clear()
+        self.processor = CountingProcessor()
+        self.service = PaymentService(self.processor)
+
+    def test_repeated_charge_returns_cached_result(self):
+        """Test that a retry returns the first result without a second charge"""
+        first = self.service.charge_customer(1000, "tok_1")
+        second = self.service.charge_customer(1000, "tok_1")
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.processor.calls, [(1000, "tok_1")])
+
+    def test_failed_charge_is_not_cached(self):
+        """Test that a declined charge can be retried"""
+        self.processor.success = False
+        self.assertFalse(self.service.charge_customer(1000, "tok_1").success)
+
+        self.processor.success = True
+        result = self.service.charge_customer(1000, "tok_1")
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(self.processor.calls), 2)
+
+    def test_different_amount_or_token_misses(self):
+        """Test that only an identical charge is deduplicated"""
+        self.service.charge_customer(1000, "tok_1")
+        self.service.charge_customer(1001, "tok_1")
+        self.service.charge_customer(1000, "tok_2")
+
+        self.assertEqual(len(self.processor.calls), 3)
+
+    def test_different_processor_misses(self):
+        """Test that the same charge through another processor is not deduplicated"""
+        other = CountingProcessor()
+        other.processor_name = "Other"
+        self.service.charge_customer(1000, "tok_1")
+        PaymentService(other).charge_customer(1000, "tok_1")
+
+        self.assertEqual(len(other.calls), 1)
+
+    async def test_async_charge_shares_the_cache(self):
+        """Test that acharge_customer deduplicates against the same keys"""
+        first = await self.service.acharge_customer(1000, "tok_1")
+        second = await self.service.acharge_customer(1000, "tok_1")
+        self.processor.success = False
+        failed = await self.service.acharge_customer(2000, "tok_1")
+        retried = await self.service.acharge_customer(2000, "tok_1")
+
+        self.assertEqual(second, first)
+        self.assertFalse(failed.success)
+        self.assertFalse(retried.success)
+        self.assertEqual(len(self.processor.calls), 3)
+
+
+class SharedHttpClientTest(SimpleTestCase):
+    """Test that processor calls reuse one pooled HTTP client"""
+
+    def setUp(self):
+        close_http_client()
+        self.addCleanup(close_http_client)
+        self.created = []
+
+        def build_client(**kwargs):
+            client = _RealAsyncClient(transport=httpx.MockTransport(_stripe_succeeded))
+            self.created.append(client)
+            return client
+
+        patcher = mock.patch.object(models.httpx, "AsyncClient", side_effect=build_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sync_calls_share_one_client(self):
+        """Test that each sync call's fresh event loop still reuses the client"""
+        processor = StripeProcessor("sk_test")
+
+        first = processor.process_payment(1000, "tok_1")
+        second = processor.process_payment(2000, "tok_2")
+
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertEqual(first.transaction_id, "ch_test")
+        self.assertEqual(len(self.created), 1)
+
+    def test_close_http_client_closes_the_client(self):
+        """Test that shutdown closes the client and a later call builds a new one"""
+        processor = StripeProcessor("sk_test")
+        processor.process_payment(1000, "tok_1")
+
+        close_http_client()
+
+        self.assertTrue(self.created[0].is_closed)
+        processor.process_payment(1000, "tok_1")
+        self.assertEqual(len(self.created), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AsyncPaymentViewsTest(SimpleTestCase):
+    """Test the async payment views end to end with the AsyncClient"""
+
+    def setUp(self):
+        # Also resets django-ratelimit's counters between tests
+        cache.clear()
+        close_http_client()
+        self.addCleanup(close_http_client)
+
+        def build_client(**kwargs):
+            return _RealAsyncClient(transport=httpx.MockTransport(_stripe_succeeded))
+
+        patcher = mock.patch.object(models.httpx, "AsyncClient", side_effect=build_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_demo_post_success(self):
+        """Test that the demo view charges, taxes and ships in one response"""
+        response = await self.async_client.post(
+            reverse("payments:payment_demo"),
+            {"market": "EU", "amount": "10.00", "payment_token": "tok_demo"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = orjson.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["processor"], "PayPal")
+        self.assertEqual(data["amount"], "10.00")
+        self.assertEqual(data["amount_cents"], 1000)
+        self.assertEqual(data["tax"], "2.00")
+        self.assertEqual(data["shipment"]["carrier"], "DHL")
+
+    async def test_demo_post_cart_amounts(self):
+        """Test that a cart is charged and taxed as the sum of its items"""
+        response = await self.async_client.post(
+            reverse("payments:payment_demo"),
+            {"market": "US", "cart_amounts": ["10.00", "5.00"]},
+        )
+
+        data = orjson.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["processor"], "Stripe")
+        self.assertEqual(data["amount_cents"], 1500)
+        self.assertEqual(data["tax"], "1.05")
+
+    async def test_demo_post_is_rate_limited(self):
+        """Test that the 21st demo charge in a minute gets a JSON 429"""
+        url = reverse("payments:payment_demo")
+        for _ in range(20):
+            response = await self.async_client.post(url, {"amount": "1.00"})
+            self.assertEqual(response.status_code, 200)
+
+        response = await self.async_client.post(url, {"amount": "1.00"})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(orjson.loads(response.content), {"error": "rate limited"})
+
+    async def test_api_payment_success(self):
+        """Test that the JSON API charges through the requested processor"""
+        response = await self.async_client.post(
+            reverse("payments:api_payment"),
+            orjson.dumps({"processor": "stripe", "amount": 12.5, "payment_token": "tok"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = orjson.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["transaction_id"], "ch_test")
+        self.assertEqual(data["amount_cents"], 1250)
+
+    async def test_views_share_one_result_shape(self):
+        """Test that every view reports the processor under the same key"""
+        api = await self.async_client.post(
+            reverse("payments:api_payment"),
+            orjson.dumps({"processor": "paypal", "amount": 10}),
+            content_type="application/json",
+        )
+        demo = await self.async_client.post(
+            reverse("payments:payment_demo"), {"market": "EU", "amount": "10"}
+        )
+        compare = await self.async_client.post(
+            reverse("payments:compare_processors"), {"amount": "10"}
+        )
+
+        results = [
+            orjson.loads(api.content),
+            orjson.loads(demo.content),
+            orjson.loads(compare.content)["paypal_result"],
+        ]
+        for result in results:
+            with self.subTest(result=result):
+                self.assertEqual(result["processor"], "PayPal")
+                self.assertNotIn("processor_name", result)
+                self.assertEqual(result["amount_cents"], 1000)
+
+    async def test_api_payment_bad_json(self):
+        """Test that a malformed body is rejected with 400"""
+        response = await self.async_client.post(
+            reverse("payments:api_payment"), b"{not json", content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", orjson.loads(response.content))
+
+    async def test_api_payment_bad_amount(self):
+        """Test that non-numeric amounts and unknown processors are rejected with 400"""
+        for body in (
+            {"processor": "stripe", "amount": "ten"},
+            {"processor": "stripe", "amount": [1]},
+            {"processor": "bitcoin", "amount": 1},
+        ):
+            with self.subTest(body=body):
+                response = await self.async_client.post(
+                    reverse("payments:api_payment"),
+                    orjson.dumps(body),
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 400)
+
+    async def test_api_payment_requires_post(self):
+        """Test that GET is refused"""
+        response = await self.async_client.get(reverse("payments:api_payment"))
+
+        self.assertEqual(response.status_code, 405)
+
+    async def test_compare_processors_success(self):
+        """Test that both processors charge through the same service code"""
+        response = await self.async_client.post(
+            reverse("payments:compare_processors"), {"amount": "50.00"}
+        )
+
+        data = orjson.loads(response.content)
+        self.assertTrue(data["stripe_result"]["success"])
+        self.assertTrue(data["paypal_result"]["success"])
+        self.assertEqual(data["stripe_result"]["processor"], "Stripe")
+        self.assertEqual(data["paypal_result"]["amount_cents"], 5000)
+
+    async def test_compare_processors_one_processor_raises(self):
+        """Test that one processor raising does not cancel or hide the other"""
+        with mock.patch.object(
+            StripeProcessor,
+            "aprocess_payment",
+            new_callable=mock.AsyncMock,
+            side_effect=RuntimeError("gateway down"),
+        ):
+            response = await self.async_client.post(
+                reverse("payments:compare_processors"), {"amount": "50.00"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = orjson.loads(response.content)
+        self.assertEqual(
+            data["stripe_result"], {"success": False, "error": "gateway down"}
+        )
+        self.assertTrue(data["paypal_result"]["success"])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AuthenticatedPaymentDemoTest(TestCase):
+    """Test the demo view for a logged-in user, whose session needs the database"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="payer", email="payer@example.com", password="payer-pass"
+        )
+
+    def setUp(self):
+        cache.clear()
+        close_http_client()
+        self.addCleanup(close_http_client)
+
+        def build_client(**kwargs):
+            return _RealAsyncClient(transport=httpx.MockTransport(_stripe_succeeded))
+
+        patcher = mock.patch.object(models.httpx, "AsyncClient", side_effect=build_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_demo_post_for_logged_in_user(self):
+        """Test that rate limiting a logged-in user does no sync ORM access"""
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.post(
+            reverse("payments:payment_demo"), {"market": "US", "amount": "10.00"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = orjson.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["amount_cents"], 1000)
@@ -3,9 +3,14 @@ Payment URLs for LSP demonstration
 """
 
 from django.urls import path
-from .views import PaymentDemoView, api_payment
+from . import views
+
+app_name = "payments"
 
 urlpatterns = [
-    path("demo/", PaymentDemoView.as_view(), name="payment_demo"),
-    path("api/", api_payment, name="api_payment"),
+    path("demo/", views.PaymentDemoView.as_view(), name="payment_demo"),
+    # The demo page posts to "compare/" relative to itself
+    path("demo/compare/", views.compare_processors, name="compare_processors"),
+    path("api/", views.api_payment, name="api_payment"),
+    path("lsp/", views.lsp_explanation, name="lsp_explanation"),
 ]
@@ -5,57 +5,117 @@ Django views to demonstrate and experiment with Liskov Substitution Principle.
 Users can test different payment processors through the web interface.
 """
 
+import asyncio
+from dataclasses import asdict
+
+import numpy as np
+import orjson
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
+from django_ratelimit.decorators import ratelimit
 from decouple import config
 
-from apps.payments.models import PaymentService
-from apps.products.market_factories import get_marketplace_factory
+from apps.payments.models import (
+    PaymentService,
+    StripeProcessor,
+    PayPalProcessor,
+    format_cents,
+    to_cents,
+)
+from apps.products.market_factories import get_services
+
+
+def _ratelimit(**kwargs):
+    """
+    django-ratelimit's decorator, keeping async views recognisable as async
+
+    Requests over the limit raise Ratelimited before any gateway call is made.
+    """
+
+    def decorator(view):
+        wrapped = ratelimit(**kwargs)(view)
+        if iscoroutinefunction(view):
+            markcoroutinefunction(wrapped)
+        return wrapped
+
+    return decorator
+
 
+def _json_response(payload, status=200):
+    """Serialize with orjson, bypassing JsonResponse's DjangoJSONEncoder"""
+    return HttpResponse(
+        orjson.dumps(payload), content_type="application/json", status=status
+    )
 
+
+def _result_payload(result):
+    """
+    PaymentResult as a JSON-ready dict, with the amount in dollars and cents
+
+    Every payment view responds with this shape; the processor is under "processor".
+    """
+    payload = asdict(result)
+    payload["processor"] = payload.pop("processor_name")
+    payload["amount"] = format_cents(result.amount)
+    payload["amount_cents"] = result.amount
+    return payload
+
+
+def ratelimited(request, exception):
+    """RATELIMIT_VIEW: JSON 429 for requests rejected by django-ratelimit"""
+    return JsonResponse({"error": "rate limited"}, status=429)
+
+
+# Keyed on the IP: "user_or_ip" reads request.user, a sync ORM query in this async view
+@method_decorator(_ratelimit(key="ip", rate="20/m", block=True), name="post")
 class PaymentDemoView(View):
-    def get(self, request):
+    async def get(self, request):
         context = {
             "stripe_api_key": config("STRIPE_API_KEY", default="test"),
             "paypal_client_id": config("PAYPAL_CLIENT_ID", default="test"),
         }
         return render(request, "payments/demo.html", context)
 
-    def post(self, request):
+    async def post(self, request):
         try:
             market = request.POST.get("market", "US")
-            amount = float(request.POST.get("amount", 0))
             payment_token = request.POST.get("payment_token", "demo_token")
+            address = "some_address"
 
-            factory = get_marketplace_factory(market)
+            payment_processor, shipping_service, tax_service = get_services(market)
 
-            payment_processor = factory.create_payment_processor()
-            shipping_service = factory.create_shipping_service()
-            tax_service = factory.create_tax_service()
+            # A cart posts one "cart_amounts" value per item; tax them in one batch call
+            cart_amounts = request.POST.getlist("cart_amounts")
+            if cart_amounts:
+                amounts_cents = np.array([to_cents(a) for a in cart_amounts], dtype=np.int64)
+                amount_cents = int(amounts_cents.sum())
+                tax_call = tax_service.acalculate_tax_batch(amounts_cents, address)
+            else:
+                amount_cents = to_cents(request.POST.get("amount", 0))
+                tax_call = tax_service.acalculate_tax(amount_cents, address)
 
             payment_service = PaymentService(payment_processor)
-            payment_result = payment_service.charge_customer(amount, payment_token)
-
-            tax = tax_service.calculate_tax(amount, "some_address")
-            shipment = shipping_service.create_shipment("some_address", {})
 
-            return JsonResponse(
-                {
-                    "success": payment_result.success,
-                    "market": market,
-                    "processor": payment_result.processor_name,
-                    "transaction_id": payment_result.transaction_id,
-                    "amount": payment_result.amount,
-                    "tax": tax,
-                    "shipment": shipment,
-                    "error_message": payment_result.error_message,
-                }
+            # Payment, tax and shipping are independent calls, so run them concurrently
+            payment_result, tax, shipment = await asyncio.gather(
+                payment_service.acharge_customer(amount_cents, payment_token),
+                tax_call,
+                shipping_service.acreate_shipment(address, {}),
             )
+            tax = int(np.sum(tax))
+
+            payload = _result_payload(payment_result)
+            payload.update(market=market, tax=format_cents(tax), shipment=shipment)
+
+            return _json_response(payload)
 
         except Exception as e:
-            return JsonResponse(
+            return _json_response(
                 {
                     "success": False,
                     "error": str(e),
@@ -65,20 +125,41 @@ class PaymentDemoView(View):
 
 
 @csrf_exempt
-def api_payment(request):
+@_ratelimit(key="ip", rate="10/m", block=True)
+async def api_payment(request):
     """
     API endpoint for payment processing
+
+    Expects a JSON body: {"processor": "stripe", "amount": 10.0, "payment_token": "..."}
     """
-    pass
+    if request.method != "POST":
+        return _json_response({"error": "POST method required"}, status=405)
+
+    try:
+        data = orjson.loads(request.body)
+        processor = _get_processor(data.get("processor", "stripe"))
+        amount_cents = to_cents(data.get("amount", 0))
+        payment_token = data.get("payment_token", "api_token")
+
+        payment_result = await PaymentService(processor).acharge_customer(
+            amount_cents, payment_token
+        )
+        return _json_response(_result_payload(payment_result))
 
+    except orjson.JSONDecodeError:
+        return _json_response({"error": "Invalid JSON body"}, status=400)
+    except (AttributeError, TypeError, ValueError, ArithmeticError) as e:
+        return _json_response({"error": str(e)}, status=400)
 
-def compare_processors(request):
+
+@_ratelimit(key="ip", rate="5/m", block=True)
+async def compare_processors(request):
     """
     View that demonstrates LSP by running the same payment through both processors
     """
     if request.method == "POST":
         try:
-            amount = float(request.POST.get("amount", 50.00))
+            amount_cents = to_cents(request.POST.get("amount", "50.00"))
             payment_token = request.POST.get("payment_token", "compare_token")
 
             # Process with both processors using the SAME code
@@ -89,24 +170,18 @@ def compare_processors(request):
             stripe_service = PaymentService(stripe_processor)
             paypal_service = PaymentService(paypal_processor)
 
-            stripe_result = stripe_service.charge_customer(amount, payment_token)
-            paypal_result = paypal_service.charge_customer(amount, payment_token)
+            # The two charges are independent; a failure in one must not cancel the other
+            stripe_result, paypal_result = await asyncio.gather(
+                stripe_service.acharge_customer(amount_cents, payment_token),
+                paypal_service.acharge_customer(amount_cents, payment_token),
+                return_exceptions=True,
+            )
 
             return JsonResponse(
                 {
                     "lsp_demonstration": "Same code processed payments through both processors!",
-                    "stripe_result": {
-                        "success": stripe_result.success,
-                        "processor": stripe_result.processor_name,
-                        "transaction_id": stripe_result.transaction_id,
-                        "amount": stripe_result.amount,
-                    },
-                    "paypal_result": {
-                        "success": paypal_result.success,
-                        "processor": paypal_result.processor_name,
-                        "transaction_id": paypal_result.transaction_id,
-                        "amount": paypal_result.amount,
-                    },
+                    "stripe_result": _comparison_payload(stripe_result),
+                    "paypal_result": _comparison_payload(paypal_result),
                     "lsp_success": "Both processors were substitutable without code changes!",
                 }
             )
@@ -117,40 +192,56 @@ def compare_processors(request):
     return JsonResponse({"error": "POST method required"}, status=405)
 
 
+def _comparison_payload(result):
+    """Serialize one processor's outcome in compare_processors"""
+    if isinstance(result, Exception):
+        return {"success": False, "error": str(result)}
+    return _result_payload(result)
+
+
+# Processors only hold their credentials, so one shared instance per type is safe
+_PROCESSOR_SINGLETONS = {
+    "stripe": StripeProcessor("sk_test_stripe_demo"),
+    "paypal": PayPalProcessor("paypal_demo_client", "paypal_demo_secret"),
+}
+
+
 def _get_processor(processor_type: str):
     """
     Factory function to create processors
 
     This function demonstrates how easy it is to add new processors
     without breaking existing code (Open-Closed Principle too!)
+    New processors only need an entry in _PROCESSOR_SINGLETONS.
     """
-    if processor_type == "stripe":
-        return StripeProcessor("sk_test_stripe_demo")
-    elif processor_type == "paypal":
-        return PayPalProcessor("paypal_demo_client", "paypal_demo_secret")
-    else:
-        raise ValueError(f"Unknown processor type: {processor_type}")
-
-
+    try:
+        return _PROCESSOR_SINGLETONS[processor_type]
+    except KeyError:
+        raise ValueError(f"Unknown processor type: {processor_type}") from None
+
+
+# The explanation page never varies per request, so its context is built once
+_LSP_EXPLANATION_CONTEXT = {
+    "principle": "Liskov Substitution Principle",
+    "definition": "Objects of a superclass should be replaceable with objects of a subclass without breaking the application.",
+    "payment_example": {
+        "interface": "PaymentProcessor",
+        "implementations": ["StripeProcessor", "PayPalProcessor"],
+        "method": "process_payment(amount_cents, token) -> PaymentResult",
+        "benefit": "Same PaymentService code works with both processors",
+    },
+    "violations_prevented": [
+        "Different method names (charge_card vs process_payment)",
+        "Different parameters (card_token vs paypal_token)",
+        "Different return types (dict vs object)",
+        "Different error handling approaches",
+    ],
+}
+
+
+@cache_page(60 * 60 * 24)
 def lsp_explanation(request):
     """
     View that explains LSP with the payment processor example
     """
-    context = {
-        "principle": "Liskov Substitution Principle",
-        "definition": "Objects of a superclass should be replaceable with objects of a subclass without breaking the application.",
-        "payment_example": {
-            "interface": "PaymentProcessor",
-            "implementations": ["StripeProcessor", "PayPalProcessor"],
-            "method": "process_payment(amount, token) -> PaymentResult",
-            "benefit": "Same PaymentService code works with both processors",
-        },
-        "violations_prevented": [
-            "Different method names (charge_card vs process_payment)",
-            "Different parameters (card_token vs paypal_token)",
-            "Different return types (dict vs object)",
-            "Different error handling approaches",
-        ],
-    }
-
-    return render(request, "payments/lsp_explanation.html", context)
+    return render(request, "payments/lsp_explanation.html", _LSP_EXPLANATION_CONTEXT)
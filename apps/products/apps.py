@@ -0,0 +1,24 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class ProductsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.products'
+
+    def ready(self):
+        from .models import ProductType
+        from .signals import invalidate_product_types_cache
+        from .type_handlers import (
+            BookHandler, ClothingHandler, ElectronicsHandler, product_registry,
+        )
+
+        # Register default handlers; re-registering on reload just replaces them
+        for handler in (BookHandler(), ElectronicsHandler(), ClothingHandler()):
+            product_registry.register_handler(handler)
+
+        # Keep the cached active product types in step with every ProductType write
+        post_save.connect(invalidate_product_types_cache, sender=ProductType,
+                          dispatch_uid='products_invalidate_types_cache_on_save')
+        post_delete.connect(invalidate_product_types_cache, sender=ProductType,
+                            dispatch_uid='products_invalidate_types_cache_on_delete')
@@ -10,6 +10,11 @@ from .services import (
     VatTaxService,
 )
 
+# Resolved once at import instead of on every processor creation
+STRIPE_API_KEY = config("STRIPE_API_KEY", default="test")
+PAYPAL_CLIENT_ID = config("PAYPAL_CLIENT_ID", default="test")
+PAYPAL_CLIENT_SECRET = config("PAYPAL_CLIENT_SECRET", default="test")
+
 
 class MarketplaceFactory(ABC):
     @abstractmethod
@@ -27,7 +32,7 @@ class MarketplaceFactory(ABC):
 
 class UsMarketFactory(MarketplaceFactory):
     def create_payment_processor(self) -> PaymentProcessor:
-        return StripeProcessor(api_key=config("STRIPE_API_KEY", default="test"))
+        return StripeProcessor(api_key=STRIPE_API_KEY)
 
     def create_shipping_service(self) -> ShippingService:
         return UspsShippingService()
@@ -39,8 +44,8 @@ class UsMarketFactory(MarketplaceFactory):
 class EuMarketFactory(MarketplaceFactory):
     def create_payment_processor(self) -> PaymentProcessor:
         return PayPalProcessor(
-            client_id=config("PAYPAL_CLIENT_ID", default="test"),
-            client_secret=config("PAYPAL_CLIENT_SECRET", default="test"),
+            client_id=PAYPAL_CLIENT_ID,
+            client_secret=PAYPAL_CLIENT_SECRET,
         )
 
     def create_shipping_service(self) -> ShippingService:
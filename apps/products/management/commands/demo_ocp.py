@@ -0,0 +1,160 @@
+"""
+Management command demonstrating Open-Closed Principle with Product model
+
+This shows:
+1. Working with 3 existing product types (Book, Electronics, Clothing)
+2. Adding a new product type (Toys) without modifying existing code
+3. How the registry pattern follows Open-Closed Principle
+
+Run this with: python manage.py demo_ocp
+"""
+
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.products.models import Product, ProductType
+from apps.products.type_handlers import product_registry, ToysHandler
+
+
+class Command(BaseCommand):
+    help = "Demonstrate the Open-Closed Principle with the product type registry"
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔧 Testing Open-Closed Principle Implementation")
+        self.stdout.write("=" * 50)
+
+        # All writes share one transaction instead of autocommitting one by one
+        with transaction.atomic():
+            self._create_default_products()
+            self._print_products("📋 Product List (using registry for display):")
+            self._demonstrate_extension()
+            self._print_products("📋 Updated Product List (including new type):")
+
+        self.stdout.write("\n🎉 OPEN-CLOSED PRINCIPLE SUCCESS!")
+        self.stdout.write("✅ Added new product type WITHOUT modifying existing code")
+        self.stdout.write("✅ Existing functionality continues to work")
+        self.stdout.write("✅ New functionality works seamlessly")
+        self.stdout.write("\nThe system is:")
+        self.stdout.write("📖 OPEN for extension (new product types)")
+        self.stdout.write("🔒 CLOSED for modification (existing code unchanged)")
+
+    def _create_default_products(self):
+        # Create product types if they don't exist
+        book_type, _ = ProductType.objects.get_or_create(
+            name='book',
+            defaults={'display_name': 'Books'}
+        )
+        electronics_type, _ = ProductType.objects.get_or_create(
+            name='electronics',
+            defaults={'display_name': 'Electronics'}
+        )
+        clothing_type, _ = ProductType.objects.get_or_create(
+            name='clothing',
+            defaults={'display_name': 'Clothing'}
+        )
+
+        self.stdout.write("✅ Product types created")
+
+        # Show current registered handlers
+        self.stdout.write(f"\n📋 Currently supported types: {product_registry.get_supported_types()}")
+
+        self.stdout.write("\n🏭 Creating products using registry pattern...")
+
+        # Simulate form data for each product type
+        book_form_data = {
+            'author': 'J.K. Rowling',
+            'isbn': '978-0439708180',
+            'pages': '309',
+            'publisher': 'Scholastic',
+            'genre': 'Fantasy'
+        }
+
+        electronics_form_data = {
+            'brand': 'Apple',
+            'model': 'iPhone 15 Pro',
+            'warranty_months': '12',
+            'specifications': 'A17 Pro chip, 128GB storage',
+            'connectivity': 'USB-C, 5G'
+        }
+
+        clothing_form_data = {
+            'size': 'L',
+            'color': 'Red',
+            'material': '100% Cotton',
+            'gender': 'Male',
+            'season': 'Summer'
+        }
+
+        # Registry processes the form data up front, so each product is a single INSERT
+        Product.objects.bulk_create([
+            Product(
+                name="Harry Potter",
+                description="Fantasy novel",
+                price=Decimal("15.99"),
+                product_type=book_type,
+                type_specific_data=product_registry.process_product_data('book', book_form_data),
+            ),
+            Product(
+                name="iPhone 15 Pro",
+                description="Latest smartphone",
+                price=Decimal("999.99"),
+                product_type=electronics_type,
+                type_specific_data=product_registry.process_product_data('electronics', electronics_form_data),
+            ),
+            Product(
+                name="Summer T-Shirt",
+                description="Lightweight shirt",
+                price=Decimal("25.99"),
+                product_type=clothing_type,
+                type_specific_data=product_registry.process_product_data('clothing', clothing_form_data),
+            ),
+        ])
+
+        self.stdout.write("✅ Products created using registry pattern")
+
+    def _demonstrate_extension(self):
+        # NOW DEMONSTRATE OPEN-CLOSED PRINCIPLE!
+        self.stdout.write("\n🎯 OPEN-CLOSED PRINCIPLE DEMONSTRATION")
+        self.stdout.write("=" * 50)
+        self.stdout.write("Adding NEW product type WITHOUT modifying existing code...")
+
+        # Create toys product type
+        toys_type, _ = ProductType.objects.get_or_create(
+            name='toys',
+            defaults={'display_name': 'Toys'}
+        )
+
+        # Register the new handler (EXTENSION without MODIFICATION!)
+        product_registry.register_handler(ToysHandler())
+
+        self.stdout.write(f"✅ New type added! Supported types: {product_registry.get_supported_types()}")
+
+        # Create a toy product using the SAME existing code
+        toys_form_data = {
+            'age_range': '3-6 years',
+            'safety_rating': 'CE certified',
+            'material': 'Non-toxic plastic',
+            'battery_required': 'Yes',
+            'educational_value': 'STEM learning'
+        }
+
+        # The SAME registry code works for the new type!
+        Product.objects.create(
+            name="Building Blocks Set",
+            description="Educational building toy",
+            price=Decimal("39.99"),
+            product_type=toys_type,
+            type_specific_data=product_registry.process_product_data('toys', toys_form_data),
+        )
+
+        self.stdout.write("🧸 Toy product created using EXISTING registry code!")
+
+    def _print_products(self, title):
+        self.stdout.write(f"\n{title}")
+        for product in Product.objects.select_related('product_type'):
+            self.stdout.write(f"- {product.get_display_info()} (${product.price})")
+            self.stdout.write(f"  Type: {product.product_type.display_name}")
+            self.stdout.write(f"  Data: {product.type_specific_data}")
+            self.stdout.write("")
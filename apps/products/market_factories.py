@@ -1,10 +1,36 @@
+from functools import lru_cache
+
 from .factories import UsMarketFactory, EuMarketFactory
 
 
 def get_marketplace_factory(market: str):
-    if market.upper() == "US":
+    return _get_marketplace_factory(market.upper())
+
+
+@lru_cache(maxsize=8)
+def _get_marketplace_factory(market: str):
+    if market == "US":
         return UsMarketFactory()
-    elif market.upper() == "EU":
+    elif market == "EU":
         return EuMarketFactory()
     else:
         raise ValueError("Unsupported market")
+
+
+def get_services(market: str):
+    """
+    Return the (payment_processor, shipping_service, tax_service) tuple for a market
+
+    The services are stateless, so each market's tuple is built once and reused.
+    """
+    return _get_services(market.upper())
+
+
+@lru_cache(maxsize=8)
+def _get_services(market: str):
+    factory = _get_marketplace_factory(market)
+    return (
+        factory.create_payment_processor(),
+        factory.create_shipping_service(),
+        factory.create_tax_service(),
+    )
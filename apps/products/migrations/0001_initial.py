@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('display_name', models.CharField(max_length=100)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'db_table': 'product_types',
+            },
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('type_specific_data', models.JSONField(default=dict)),
+                ('product_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.producttype')),
+            ],
+            options={
+                'db_table': 'products',
+                'indexes': [models.Index(fields=['product_type', 'is_active'], name='products_product_74cecb_idx'), models.Index(fields=['is_active'], name='products_is_acti_cb485f_idx')],
+            },
+        ),
+    ]
@@ -70,9 +70,14 @@ class Product(models.Model):
     def get_by_id_with_data(cls, product_id):
         """
         Get product by ID (JSON data is always loaded with the product)
+        
+        Only the columns the detail page uses are fetched.
         """
         try:
-            return cls.objects.select_related('product_type').get(id=product_id)
+            return cls.objects.select_related('product_type').only(
+                'id', 'name', 'description', 'price', 'is_active', 'type_specific_data',
+                'product_type__name', 'product_type__display_name', 'product_type__is_active',
+            ).get(id=product_id)
         except cls.DoesNotExist:
             return None
     
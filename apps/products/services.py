@@ -1,17 +1,36 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class ShippingService(ABC):
     @abstractmethod
     def create_shipment(self, address: str, order_details: dict) -> dict:
         pass
 
+    async def acreate_shipment(self, address: str, order_details: dict) -> dict:
+        return self.create_shipment(address, order_details)
+
 
 class TaxService(ABC):
+    # Flat tax rate for the market, in basis points (700 is 7%)
+    _rate_bp: int = 0
+
     @abstractmethod
-    def calculate_tax(self, amount: float, address: str) -> float:
+    def calculate_tax(self, amount_cents: int, address: str) -> int:
         pass
 
+    async def acalculate_tax(self, amount_cents: int, address: str) -> int:
+        return self.calculate_tax(amount_cents, address)
+
+    def calculate_tax_batch(self, amounts_cents: np.ndarray, address: str) -> np.ndarray:
+        """Tax for every amount in a cart, rounded half up like calculate_tax"""
+        amounts_cents = np.asarray(amounts_cents, dtype=np.int64)
+        return (amounts_cents * self._rate_bp + 5000) // 10000
+
+    async def acalculate_tax_batch(self, amounts_cents: np.ndarray, address: str) -> np.ndarray:
+        return self.calculate_tax_batch(amounts_cents, address)
+
 
 # US Market Services
 class UspsShippingService(ShippingService):
@@ -21,9 +40,11 @@ class UspsShippingService(ShippingService):
 
 
 class UsTaxService(TaxService):
-    def calculate_tax(self, amount: float, address: str) -> float:
-        # Logic for US tax calculation
-        return amount * 0.07
+    _rate_bp = 700
+
+    def calculate_tax(self, amount_cents: int, address: str) -> int:
+        # Logic for US tax calculation; integer math, half a cent rounds up
+        return (amount_cents * self._rate_bp + 5000) // 10000
 
 
 # EU Market Services
@@ -34,6 +55,8 @@ class DhlShippingService(ShippingService):
 
 
 class VatTaxService(TaxService):
-    def calculate_tax(self, amount: float, address: str) -> float:
-        # Logic for VAT calculation
-        return amount * 0.20
+    _rate_bp = 2000
+
+    def calculate_tax(self, amount_cents: int, address: str) -> int:
+        # Logic for VAT calculation; integer math, half a cent rounds up
+        return (amount_cents * self._rate_bp + 5000) // 10000
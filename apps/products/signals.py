@@ -0,0 +1,15 @@
+"""
+Signal receivers for the products app
+
+Connected in ProductsConfig.ready(), so they are registered whether or not a
+request ever imports the views.
+"""
+
+from django.core.cache import cache
+
+from .views import PRODUCT_TYPES_CACHE_KEY
+
+
+def invalidate_product_types_cache(sender, **kwargs):
+    """Drop the cached product types whenever one is saved or deleted"""
+    cache.delete(PRODUCT_TYPES_CACHE_KEY)
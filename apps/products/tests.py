@@ -0,0 +1,295 @@
+"""
+Tests for the product type handlers, their registry, services and views
+"""
+
+from decimal import Decimal
+from unittest import mock
+
+import numpy as np
+from django.core.cache import cache
+from django.http import HttpResponse, QueryDict
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.safestring import mark_safe
+
+from . import views
+from .models import Product, ProductType
+from .services import UsTaxService, VatTaxService
+from .type_handlers import (
+    BookHandler,
+    ClothingHandler,
+    ElectronicsHandler,
+    ProductTypeHandler,
+    ProductTypeRegistry,
+    ToysHandler,
+)
+
+HANDLER_CLASSES = (BookHandler, ElectronicsHandler, ClothingHandler, ToysHandler)
+
+# Keep cached product types in process memory, isolated from any shared cache
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class TaxServiceTest(SimpleTestCase):
+    """Test the flat per-market tax services"""
+
+    def test_market_rates(self):
+        """Test that each market applies its flat rate, whatever the address"""
+        self.assertEqual(UsTaxService().calculate_tax(1000, "NY"), 70)
+        self.assertEqual(UsTaxService().calculate_tax(1000, "CA"), 70)
+        self.assertEqual(VatTaxService().calculate_tax(1000, "Berlin"), 200)
+
+    def test_half_cent_rounds_up(self):
+        """Test that half a cent of tax rounds up, not to the even cent"""
+        self.assertEqual(UsTaxService().calculate_tax(950, "NY"), 67)
+        self.assertEqual(UsTaxService().calculate_tax(150, "NY"), 11)
+        self.assertEqual(UsTaxService().calculate_tax(50, "NY"), 4)
+        self.assertEqual(UsTaxService().calculate_tax(949, "NY"), 66)
+
+    def test_batch_matches_single_amounts(self):
+        """Test that the vectorized cart tax equals taxing each item"""
+        tax_service = UsTaxService()
+        amounts_cents = np.array([1000, 2500, 199], dtype=np.int64)
+
+        self.assertEqual(
+            tax_service.calculate_tax_batch(amounts_cents, "NY").tolist(),
+            [tax_service.calculate_tax(int(amount), "NY") for amount in amounts_cents],
+        )
+
+    def test_batch_matches_single_amounts_on_half_cents(self):
+        """Test that the batch path rounds half a cent up like the scalar path"""
+        # 50 cent steps up to $1000 hit every half-cent case at 7%
+        amounts_cents = np.arange(50, 100001, 50, dtype=np.int64)
+
+        for tax_service in (UsTaxService(), VatTaxService()):
+            with self.subTest(tax_service=type(tax_service).__name__):
+                self.assertEqual(
+                    tax_service.calculate_tax_batch(amounts_cents, "").tolist(),
+                    [tax_service.calculate_tax(int(amount), "") for amount in amounts_cents],
+                )
+        self.assertEqual(UsTaxService().calculate_tax_batch(np.array([950]), "NY").tolist(), [67])
+
+
+def _reference_form_data(fields, form_data):
+    """The hand-written process_form_data the generated extractors replaced"""
+    data = {}
+    for name, field_type, default in fields:
+        if field_type is int:
+            data[name] = int(form_data.get(name, 0)) if form_data.get(name) else default
+        else:
+            data[name] = form_data.get(name, default)
+    return data
+
+
+class GeneratedFormExtractorTest(SimpleTestCase):
+    """Test the process_form_data generated from each handler's FIELDS"""
+
+    def _assert_matches_reference(self, form_data):
+        for handler_class in HANDLER_CLASSES:
+            with self.subTest(handler=handler_class.__name__):
+                self.assertEqual(
+                    handler_class().process_form_data(form_data),
+                    _reference_form_data(handler_class.FIELDS, form_data),
+                )
+
+    def test_all_fields_submitted(self):
+        """Test that submitted values are copied and int fields are parsed"""
+        form_data = QueryDict(mutable=True)
+        for handler_class in HANDLER_CLASSES:
+            for name, field_type, default in handler_class.FIELDS:
+                form_data[name] = "12" if field_type is int else f"{name} value"
+
+        self._assert_matches_reference(form_data)
+        self.assertEqual(BookHandler().process_form_data(form_data)["pages"], 12)
+
+    def test_missing_fields_use_defaults(self):
+        """Test that absent fields fall back to each FIELDS default"""
+        self._assert_matches_reference(QueryDict())
+        self.assertEqual(ToysHandler().process_form_data({})["battery_required"], "No")
+        self.assertEqual(BookHandler().process_form_data({})["pages"], 0)
+
+    def test_empty_fields(self):
+        """Test that empty strings are kept for str fields and default for int fields"""
+        form_data = QueryDict(mutable=True)
+        for handler_class in HANDLER_CLASSES:
+            for name, field_type, default in handler_class.FIELDS:
+                form_data[name] = ""
+
+        self._assert_matches_reference(form_data)
+        book_data = BookHandler().process_form_data(form_data)
+        self.assertEqual(book_data["author"], "")
+        self.assertEqual(book_data["publication_year"], 0)
+
+    def test_bad_int_raises_value_error(self):
+        """Test that non-numeric input for an int field is reported, not defaulted"""
+        with self.assertRaises(ValueError):
+            BookHandler().process_form_data({"pages": "many"})
+        with self.assertRaises(ValueError):
+            ElectronicsHandler().process_form_data({"warranty_months": "1.5"})
+
+
+class ProductTypeRegistryTest(SimpleTestCase):
+    """Test handler lookup in ProductTypeRegistry"""
+
+    def setUp(self):
+        self.registry = ProductTypeRegistry()
+        self.handlers = [BookHandler(), ElectronicsHandler(), ClothingHandler()]
+        for handler in self.handlers:
+            self.registry.register_handler(handler)
+
+    def test_get_handler_for_each_type(self):
+        """Test that every registered name resolves, even from a distinct str object"""
+        for handler in self.handlers:
+            with self.subTest(type_name=handler.TYPE_NAME):
+                # Build an equal but distinct str object, as form input would be
+                name = "".join(list(handler.TYPE_NAME))
+                self.assertIs(self.registry.get_handler(name), handler)
+
+    def test_get_handler_str_subclass(self):
+        """Test that str subclasses such as SafeString resolve like plain names"""
+        self.assertIs(self.registry.get_handler(mark_safe("book")), self.handlers[0])
+
+    def test_unknown_name_returns_none(self):
+        """Test that unregistered names fall through to None"""
+        for name in ("toys", "", "Book"):
+            with self.subTest(name=name):
+                self.assertIsNone(self.registry.get_handler(name))
+
+    def test_get_handler_non_str_returns_none(self):
+        """Test that None and non-str names are treated as unknown types"""
+        for name in (None, 1, b"book", ["book"]):
+            with self.subTest(name=name):
+                self.assertIsNone(self.registry.get_handler(name))
+
+    def test_reregistering_replaces_handler(self):
+        """Test that registering a name again resolves to the new handler"""
+        replacement = BookHandler()
+        self.registry.register_handler(replacement)
+
+        self.assertIs(self.registry.get_handler("book"), replacement)
+        self.assertEqual(len(self.registry.get_all_handlers()), 3)
+
+    def test_register_handler_overriding_get_type_name(self):
+        """Test that a handler naming its type in get_type_name() registers under it"""
+
+        class GiftCardHandler(ProductTypeHandler):
+            FIELDS = (("value", int, 0),)
+
+            def get_type_name(self):
+                return "gift_card"
+
+            def get_display_info_from_dict(self, name, type_data):
+                return name
+
+        handler = GiftCardHandler()
+        self.registry.register_handler(handler)
+
+        self.assertIs(self.registry.get_handler("gift_card"), handler)
+        self.assertIn("gift_card", self.registry.get_supported_types())
+
+    def test_process_product_data_with_missing_type(self):
+        """Test that a missing type name falls back to empty type data"""
+        self.assertEqual(self.registry.process_product_data(None, {"author": "X"}), {})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProductListViewTest(TestCase):
+    """Test the product list built by _handle_product_list"""
+
+    @classmethod
+    def setUpTestData(cls):
+        book = ProductType.objects.create(name="book", display_name="Books")
+        toys = ProductType.objects.create(name="toys", display_name="Toys")
+        Product.objects.create(
+            name="Dune",
+            price=Decimal("9.99"),
+            product_type=book,
+            type_specific_data={"author": "Frank Herbert"},
+        )
+        Product.objects.create(
+            name="Blocks",
+            price=Decimal("19.99"),
+            product_type=toys,
+            type_specific_data={"age_range": "3-6"},
+        )
+
+    def _list_context(self, path="/products/"):
+        """Run the list view and return the context handed to render()"""
+        with mock.patch.object(views, "render", return_value=HttpResponse()) as render:
+            views._handle_product_list(RequestFactory().get(path))
+        return render.call_args.args[2]
+
+    def test_type_name_comes_from_the_product_type(self):
+        """Test that type_name is set even when no handler is registered"""
+        rows = {
+            data["product"]["name"]: data
+            for data in self._list_context()["products_data"]
+        }
+
+        self.assertEqual(rows["Dune"]["type_name"], "book")
+        self.assertEqual(rows["Dune"]["display_info"], "Dune by Frank Herbert")
+        self.assertEqual(rows["Blocks"]["type_name"], "toys")
+        self.assertEqual(rows["Blocks"]["display_info"], "Blocks")
+
+    def test_renamed_type_resolves_without_a_restart(self):
+        """Test that a type renamed with QuerySet.update() dispatches to its handler"""
+        ProductType.objects.filter(name="toys").update(name="clothing")
+
+        rows = {
+            data["product"]["name"]: data
+            for data in self._list_context()["products_data"]
+        }
+
+        self.assertEqual(rows["Blocks"]["type_name"], "clothing")
+        self.assertEqual(rows["Blocks"]["display_info"], "Blocks -")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ActiveProductTypesCacheTest(TestCase):
+    """Test the shared cache behind _get_active_product_types"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = ProductType.objects.create(name="book", display_name="Books")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_product_types_are_cached(self):
+        """Test that only the first call queries the database"""
+        with self.assertNumQueries(1):
+            views._get_active_product_types()
+        with self.assertNumQueries(0):
+            product_types = views._get_active_product_types()
+
+        self.assertEqual([product_type.name for product_type in product_types], ["book"])
+
+    def test_save_invalidates_the_cache(self):
+        """Test that saving a product type drops the cached list"""
+        views._get_active_product_types()
+
+        self.book.is_active = False
+        self.book.save()
+
+        self.assertEqual(views._get_active_product_types(), [])
+
+    def test_model_writes_invalidate_the_cache_without_the_views(self):
+        """Test that the receivers connected in ready() fire for plain ORM writes"""
+        cache.set(views.PRODUCT_TYPES_CACHE_KEY, ["stale"])
+        toys = ProductType.objects.create(name="toys", display_name="Toys")
+        self.assertIsNone(cache.get(views.PRODUCT_TYPES_CACHE_KEY))
+
+        cache.set(views.PRODUCT_TYPES_CACHE_KEY, ["stale"])
+        toys.delete()
+        self.assertIsNone(cache.get(views.PRODUCT_TYPES_CACHE_KEY))
+
+    def test_cache_entry_has_a_timeout(self):
+        """Test that writes bypassing the signals are only stale until the timeout"""
+        with mock.patch.object(views, "cache") as mock_cache:
+            mock_cache.get.return_value = None
+            views._get_active_product_types()
+
+        mock_cache.set.assert_called_once_with(
+            views.PRODUCT_TYPES_CACHE_KEY, mock.ANY, views.PRODUCT_TYPES_CACHE_TIMEOUT
+        )
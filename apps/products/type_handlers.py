@@ -8,8 +8,39 @@ Open for extension: Easy to add new product types
 Closed for modification: Existing code doesn't need changes
 """
 
+import logging
+import types
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
+
+def _build_form_extractor(fields):
+    """
+    Generate a straight-line process_form_data from a FIELDS schema
+
+    Each (name, type, default) entry becomes one dict item backed by a single
+    form_data lookup; int fields fall back to their default when the submitted
+    value is empty. `int` is bound as a default argument so the generated code
+    uses a fast local lookup. Non-numeric input still raises ValueError so the
+    view can report it instead of silently storing the default.
+    """
+    lines = [
+        "def process_form_data(self, form_data, _int=int):",
+        "    g = form_data.get",
+        "    return {",
+    ]
+    for name, field_type, default in fields:
+        if field_type is int:
+            lines.append(f"        {name!r}: _int(g({name!r}) or {default!r}),")
+        else:
+            lines.append(f"        {name!r}: g({name!r}, {default!r}),")
+    lines.append("    }")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["process_form_data"]
+
 
 class ProductTypeHandler(ABC):
     """
@@ -17,12 +48,27 @@ class ProductTypeHandler(ABC):
     
     Each product type should have its own handler that knows
     how to process data for that specific type.
+
+    Subclasses may declare FIELDS as (name, type, default) tuples instead of
+    writing process_form_data by hand; the method is generated from it.
     """
+
+    # Handlers are stateless singletons; no per-instance __dict__
+    __slots__ = ()
+
+    # Product type name this handler supports; set it or override get_type_name()
+    TYPE_NAME: str = None
+    FIELDS = ()
+    SEARCH_FIELDS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "FIELDS" in cls.__dict__:
+            cls.process_form_data = _build_form_extractor(cls.FIELDS)
     
-    @abstractmethod
     def get_type_name(self):
-        """Return the product type name this handler supports"""
-        pass
+        """Return the product type name this handler supports (TYPE_NAME by default)"""
+        return self.TYPE_NAME
     
     @abstractmethod
     def process_form_data(self, form_data):
@@ -37,102 +83,123 @@ class ProductTypeHandler(ABC):
         """
         pass
     
-    @abstractmethod
-    def get_display_info(self, product):
+    def get_display_info(self, product, type_data=None):
         """
         Get formatted display information for this product type
         
         Args:
             product: Product instance
+            type_data: Pre-extracted type_specific_data; read from product if omitted
             
         Returns:
             Formatted string for display
         """
-        pass
+        if type_data is None:
+            type_data = product.type_specific_data
+        return self.get_display_info_from_dict(product.name, type_data)
     
     @abstractmethod
-    def get_search_fields(self):
+    def get_display_info_from_dict(self, name, type_data):
         """
-        Return list of fields that can be searched for this product type
+        Get formatted display information from raw column values
         
+        Used by list views that fetch rows with .values() instead of model instances.
+        
+        Args:
+            name: Product name
+            type_data: The product's type_specific_data dict
+            
         Returns:
-            List of field names
+            Formatted string for display
         """
         pass
+    
+    def get_search_fields(self):
+        """
+        Return the fields that can be searched for this product type
+        
+        Returns:
+            Tuple of field names (shared, not copied per call)
+        """
+        return self.SEARCH_FIELDS
 
 
 class BookHandler(ProductTypeHandler):
     """Handler for book products"""
     
-    def get_type_name(self):
-        return 'book'
-    
-    def process_form_data(self, form_data):
-        return {
-            'author': form_data.get('author', ''),
-            'isbn': form_data.get('isbn', ''),
-            'pages': int(form_data.get('pages', 0)) if form_data.get('pages') else 0,
-            'publisher': form_data.get('publisher', ''),
-            'genre': form_data.get('genre', ''),
-            'publication_year': int(form_data.get('publication_year', 0)) if form_data.get('publication_year') else 0,
-        }
+    __slots__ = ()
+
+    TYPE_NAME = 'book'
+    FIELDS = (
+        ('author', str, ''),
+        ('isbn', str, ''),
+        ('pages', int, 0),
+        ('publisher', str, ''),
+        ('genre', str, ''),
+        ('publication_year', int, 0),
+    )
     
-    def get_display_info(self, product):
-        author = product.get_type_data('author', 'Unknown Author')
-        return f"{product.name} by {author}"
+    SEARCH_FIELDS = ('author', 'isbn', 'publisher', 'genre')
     
-    def get_search_fields(self):
-        return ['author', 'isbn', 'publisher', 'genre']
+    def get_display_info_from_dict(self, name, type_data):
+        author = type_data.get('author', 'Unknown Author')
+        return f"{name} by {author}"
 
 
 class ElectronicsHandler(ProductTypeHandler):
     """Handler for electronics products"""
     
-    def get_type_name(self):
-        return 'electronics'
+    __slots__ = ()
+
+    TYPE_NAME = 'electronics'
+    FIELDS = (
+        ('brand', str, ''),
+        ('model', str, ''),
+        ('warranty_months', int, 0),
+        ('specifications', str, ''),
+        ('power_consumption', str, ''),
+        ('connectivity', str, ''),
+    )
     
-    def process_form_data(self, form_data):
-        return {
-            'brand': form_data.get('brand', ''),
-            'model': form_data.get('model', ''),
-            'warranty_months': int(form_data.get('warranty_months', 0)) if form_data.get('warranty_months') else 0,
-            'specifications': form_data.get('specifications', ''),
-            'power_consumption': form_data.get('power_consumption', ''),
-            'connectivity': form_data.get('connectivity', ''),
-        }
+    SEARCH_FIELDS = ('brand', 'model', 'specifications')
     
-    def get_display_info(self, product):
-        brand = product.get_type_data('brand', 'Unknown Brand')
-        model = product.get_type_data('model', '')
-        return f"{brand} {model}".strip()
+    def get_display_info_from_dict(self, name, type_data):
+        return self._format(type_data.get('brand', 'Unknown Brand'), type_data.get('model', ''))
     
-    def get_search_fields(self):
-        return ['brand', 'model', 'specifications']
+    @staticmethod
+    def _format(brand, model):
+        # Only build the joined string when both parts are present
+        if not model:
+            return brand
+        return f"{brand} {model}" if brand else model
 
 
 class ClothingHandler(ProductTypeHandler):
     """Handler for clothing products"""
     
-    def get_type_name(self):
-        return 'clothing'
+    __slots__ = ()
+
+    TYPE_NAME = 'clothing'
+    FIELDS = (
+        ('size', str, ''),
+        ('color', str, ''),
+        ('material', str, ''),
+        ('gender', str, ''),
+        ('season', str, ''),
+        ('care_instructions', str, ''),
+    )
     
-    def process_form_data(self, form_data):
-        return {
-            'size': form_data.get('size', ''),
-            'color': form_data.get('color', ''),
-            'material': form_data.get('material', ''),
-            'gender': form_data.get('gender', ''),
-            'season': form_data.get('season', ''),
-            'care_instructions': form_data.get('care_instructions', ''),
-        }
+    SEARCH_FIELDS = ('color', 'material', 'size', 'gender')
     
-    def get_display_info(self, product):
-        color = product.get_type_data('color', '')
-        size = product.get_type_data('size', '')
-        return f"{product.name} - {color} {size}".strip()
+    def get_display_info_from_dict(self, name, type_data):
+        return self._format(name, type_data.get('color', ''), type_data.get('size', ''))
     
-    def get_search_fields(self):
-        return ['color', 'material', 'size', 'gender']
+    @staticmethod
+    def _format(name, color, size):
+        # Pick the final layout up front instead of formatting then stripping
+        if size:
+            return f"{name} - {color or ''} {size}"
+        return f"{name} - {color}" if color else f"{name} -"
 
 
 class ProductTypeRegistry:
@@ -156,7 +223,7 @@ class ProductTypeRegistry:
         """
         type_name = handler.get_type_name()
         self._handlers[type_name] = handler
-        print(f"✅ Registered handler for product type: {type_name}")
+        logger.debug("Registered handler for product type: %s", type_name)
     
     def get_handler(self, product_type_name):
         """
@@ -168,11 +235,15 @@ class ProductTypeRegistry:
         Returns:
             ProductTypeHandler instance or None if not found
         """
-        return self._handlers.get(product_type_name)
+        try:
+            return self._handlers.get(product_type_name)
+        except TypeError:
+            # Names come from form and database values; an unhashable one is unknown
+            return None
     
     def get_all_handlers(self):
-        """Get all registered handlers"""
-        return self._handlers.copy()
+        """Get a read-only view of all registered handlers (call .copy() to mutate)"""
+        return types.MappingProxyType(self._handlers)
     
     def get_supported_types(self):
         """Get list of all supported product type names"""
@@ -194,7 +265,7 @@ class ProductTypeRegistry:
             return handler.process_form_data(form_data)
         else:
             # Fallback for unknown types - still open for extension!
-            print(f"⚠️ No handler found for product type: {product_type_name}")
+            logger.debug("No handler found for product type: %s", product_type_name)
             return {}
     
     def get_display_info(self, product):
@@ -209,20 +280,36 @@ class ProductTypeRegistry:
         """
         handler = self.get_handler(product.product_type.name)
         if handler:
-            return handler.get_display_info(product)
+            # Read the JSON field once and hand the dict down to the handler
+            return handler.get_display_info(product, product.type_specific_data)
         else:
             # Fallback for unknown types
             return product.name
+    
+    def get_display_info_from_dict(self, product_type_name, name, type_data):
+        """
+        Get display info from raw column values using the appropriate handler
+        
+        Args:
+            product_type_name: Name of the product type
+            name: Product name
+            type_data: The product's type_specific_data dict
+            
+        Returns:
+            Formatted display string
+        """
+        handler = self.get_handler(product_type_name)
+        if handler:
+            return handler.get_display_info_from_dict(name, type_data)
+        else:
+            # Fallback for unknown types
+            return name
 
 
 # Create global registry instance
+# Default handlers are registered in ProductsConfig.ready(), not at import time
 product_registry = ProductTypeRegistry()
 
-# Register default handlers (this can be done in apps.py or anywhere)
-product_registry.register_handler(BookHandler())
-product_registry.register_handler(ElectronicsHandler())
-product_registry.register_handler(ClothingHandler())
-
 
 # Example of extending without modifying existing code!
 class ToysHandler(ProductTypeHandler):
@@ -231,24 +318,22 @@ class ToysHandler(ProductTypeHandler):
     This demonstrates the Open-Closed Principle in action!
     """
     
-    def get_type_name(self):
-        return 'toys'
-    
-    def process_form_data(self, form_data):
-        return {
-            'age_range': form_data.get('age_range', ''),
-            'safety_rating': form_data.get('safety_rating', ''),
-            'material': form_data.get('material', ''),
-            'battery_required': form_data.get('battery_required', 'No'),
-            'educational_value': form_data.get('educational_value', ''),
-        }
+    __slots__ = ()
+
+    TYPE_NAME = 'toys'
+    FIELDS = (
+        ('age_range', str, ''),
+        ('safety_rating', str, ''),
+        ('material', str, ''),
+        ('battery_required', str, 'No'),
+        ('educational_value', str, ''),
+    )
     
-    def get_display_info(self, product):
-        age_range = product.get_type_data('age_range', '')
-        return f"{product.name} (Ages {age_range})" if age_range else product.name
+    SEARCH_FIELDS = ('age_range', 'material', 'educational_value')
     
-    def get_search_fields(self):
-        return ['age_range', 'material', 'educational_value']
+    def get_display_info_from_dict(self, name, type_data):
+        age_range = type_data.get('age_range', '')
+        return f"{name} (Ages {age_range})" if age_range else name
 
 # Register the new handler (can be done anywhere without modifying existing code!)
 # product_registry.register_handler(ToysHandler())
\ No newline at end of file
@@ -1,10 +1,29 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.http import JsonResponse
 from django.contrib import messages
+from django.core.cache import cache
 from django.db import transaction
 from .models import Product, ProductType
 
 
+# Product types are near-static configuration, so the active list is cached.
+# The shared cache keeps every worker in step; the timeout bounds staleness for
+# writes that bypass the signals (see signals.py), such as QuerySet.update().
+PRODUCT_TYPES_CACHE_KEY = 'products:active_product_types'
+PRODUCT_TYPES_CACHE_TIMEOUT = 300
+
+
+def _get_active_product_types():
+    """Return the active product types, querying the database only on a cache miss"""
+    product_types = cache.get(PRODUCT_TYPES_CACHE_KEY)
+    if product_types is None:
+        product_types = list(
+            ProductType.objects.filter(is_active=True).only('id', 'name', 'display_name')
+        )
+        cache.set(PRODUCT_TYPES_CACHE_KEY, product_types, PRODUCT_TYPES_CACHE_TIMEOUT)
+    return product_types
+
+
 def product_view(request, product_id=None):
     """
     Unified view that handles:
@@ -36,26 +55,40 @@ def _handle_product_list(request):
     """Handle listing products with optional filtering"""
     product_type_filter = request.GET.get('type')
     
-    # Get all products with their types (JSON data is loaded automatically)
-    products = Product.objects.select_related('product_type').filter(is_active=True)
+    from .type_handlers import product_registry
+    
+    # Fetch plain rows; no model instances are built for the list
+    products = Product.objects.filter(is_active=True)
     
     # Apply filter if specified
     if product_type_filter:
         products = products.filter(product_type__name=product_type_filter)
     
-    # Build product data
+    rows = products.values_list(
+        'id', 'name', 'description', 'price', 'type_specific_data', 'product_type__name'
+    )
+    
+    # Resolve each type's handler once per page rather than once per row
+    handlers = {}
+    get_handler = product_registry.get_handler
+    
+    # Build product data from plain tuples
     products_data = []
-    for product in products:
+    for pk, name, description, price, type_data, type_name in rows:
+        try:
+            handler = handlers[type_name]
+        except KeyError:
+            handler = handlers[type_name] = get_handler(type_name)
         products_data.append({
-            'product': product,
-            'type_data': product.type_specific_data,
-            'type_name': product.product_type.name,
-            'display_info': product.get_display_info()
+            'product': {'id': pk, 'name': name, 'description': description, 'price': price},
+            'type_data': type_data,
+            'type_name': type_name,
+            'display_info': handler.get_display_info_from_dict(name, type_data) if handler else name,
         })
     
     context = {
         'products_data': products_data,
-        'product_types': ProductType.objects.filter(is_active=True),
+        'product_types': _get_active_product_types(),
         'current_filter': product_type_filter,
         'view_mode': 'list'
     }
@@ -75,7 +108,7 @@ def _handle_product_detail(request, product_id):
         'type_data': product.type_specific_data,
         'type_name': product.product_type.name,
         'display_info': product.get_display_info(),
-        'product_types': ProductType.objects.filter(is_active=True),
+        'product_types': _get_active_product_types(),
         'view_mode': 'detail'
     }
     
@@ -88,19 +121,19 @@ def _handle_product_create(request):
         with transaction.atomic():
             # Get basic product data
             product_type_id = request.POST.get('product_type')
-            product_type = get_object_or_404(ProductType, id=product_type_id)
+            # Only the name is needed to pick the handler
+            product_type = get_object_or_404(ProductType.objects.only('id', 'name'), id=product_type_id)
+            type_data = _build_type_specific_data(product_type.name, request.POST)
             
-            # Create the main product
+            # Create the main product with its type-specific data in one INSERT
             product = Product.objects.create(
                 name=request.POST.get('name'),
                 description=request.POST.get('description', ''),
                 price=request.POST.get('price'),
-                product_type=product_type
+                product_type=product_type,
+                type_specific_data=type_data,
             )
             
-            # Set type-specific data based on product type
-            _set_type_specific_data(product, request.POST)
-            
             messages.success(request, f'Product "{product.name}" created successfully!')
             return redirect('product_view', product_id=product.id)
             
@@ -111,20 +144,21 @@ def _handle_product_create(request):
 
 def _handle_product_update(request, product_id):
     """Handle updating an existing product"""
-    product = get_object_or_404(Product, id=product_id)
+    product = get_object_or_404(Product.objects.select_related('product_type'), id=product_id)
     
     try:
         with transaction.atomic():
-            # Update basic product fields
-            product.name = request.POST.get('name')
-            product.description = request.POST.get('description', '')
-            product.price = request.POST.get('price')
-            product.save()
+            name = request.POST.get('name')
             
-            # Update type-specific data
-            _set_type_specific_data(product, request.POST)
+            # Basic fields and type-specific data go out in a single UPDATE
+            Product.objects.filter(pk=product.pk).update(
+                name=name,
+                description=request.POST.get('description', ''),
+                price=request.POST.get('price'),
+                type_specific_data=_build_type_specific_data(product.product_type.name, request.POST),
+            )
             
-            messages.success(request, f'Product "{product.name}" updated successfully!')
+            messages.success(request, f'Product "{name}" updated successfully!')
             return redirect('product_view', product_id=product.id)
             
     except Exception as e:
@@ -132,9 +166,9 @@ def _handle_product_update(request, product_id):
         return redirect('product_view', product_id=product_id)
 
 
-def _set_type_specific_data(product, post_data):
+def _build_type_specific_data(type_name, post_data):
     """
-    Set type-specific data using registry pattern
+    Build type-specific data using registry pattern
     
     This function now follows the Open-Closed Principle:
     - Open for extension: New product types can be added by registering handlers
@@ -142,10 +176,5 @@ def _set_type_specific_data(product, post_data):
     """
     from .type_handlers import product_registry
     
-    type_name = product.product_type.name
-    
     # Use registry to process data - no if/elif chains needed!
-    type_specific_data = product_registry.process_product_data(type_name, post_data)
-    
-    product.type_specific_data = type_specific_data
-    product.save()
\ No newline at end of file
+    return product_registry.process_product_data(type_name, post_data)
@@ -54,6 +54,8 @@ def example_buyer_creation():
     result = create_account(UserType.BUYER, buyer_data)
 
     if result.is_successful:
+        # The factory caches the created profile rows on the user, so the
+        # relation reads below need no further queries
         user = result.user
         buyer_profile = result.profile_data["buyer_profile"]
 
@@ -116,6 +118,8 @@ def example_seller_creation():
     result = create_account(UserType.SELLER, seller_data)
 
     if result.is_successful:
+        # The factory caches the created profile rows on the user, so the
+        # relation reads below need no further queries
         user = result.user
         seller_profile = result.profile_data["seller_profile"]
 
@@ -185,6 +189,8 @@ def example_admin_creation():
     result = create_account(UserType.ADMIN, admin_data)
 
     if result.is_successful:
+        # The factory caches the created profile rows on the user, so the
+        # relation reads below need no further queries
         user = result.user
         admin_profile = result.profile_data["admin_profile"]
 
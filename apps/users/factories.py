@@ -13,10 +13,21 @@ The Abstract Factory pattern is ideal here because:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from collections import defaultdict
+from typing import Dict, Any, List
 from django.contrib.auth import get_user_model
-from django.db import transaction
-from .models import UserType, BuyerProfile, SellerProfile, AdminProfile
+from django.db import IntegrityError, transaction
+from .models import (
+    UserType,
+    UserProfile,
+    UserPreferences,
+    UserAnalytics,
+    UserActivityCounters,
+    UserBusinessInfo,
+    BuyerProfile,
+    SellerProfile,
+    AdminProfile,
+)
 
 User = get_user_model()
 
@@ -27,8 +38,15 @@ class AccountCreationResult:
 
     This provides a clean interface for accessing the created user and
     all associated profile objects.
+
+    The child rows are attached to result.user's relation cache when they are
+    built, so user.profile, user.preferences, user.analytics,
+    user.activity_counters, user.business_info and the type-specific profile
+    (e.g. user.buyer_profile) are read without further queries.
     """
 
+    __slots__ = ("user", "profile_data", "success", "errors")
+
     def __init__(self, user: User, profile_data: Dict[str, Any]):
         self.user = user
         self.profile_data = profile_data
@@ -63,6 +81,14 @@ class AccountFactoryAbstract(ABC):
     - Any additional setup required for the user type
     """
 
+    # User type this factory creates; set it or override get_user_type()
+    USER_TYPE: UserType = None
+
+    # Field defaults for the type-specific profile and for UserPreferences;
+    # any key also present in user_data is overridden by the submitted value
+    PROFILE_DEFAULTS: Dict[str, Any] = {}
+    PREFERENCES_DEFAULTS: Dict[str, Any] = {}
+
     @abstractmethod
     def create_account(self, user_data: Dict[str, Any]) -> AccountCreationResult:
         """
@@ -78,39 +104,48 @@ class AccountFactoryAbstract(ABC):
         """
         pass
 
-    @abstractmethod
-    def get_user_type(self) -> UserType:
-        """Return the user type this factory creates"""
-        pass
+    @classmethod
+    def get_user_type(cls) -> UserType:
+        """Return the user type this factory creates (USER_TYPE by default)"""
+        return cls.USER_TYPE
 
-    def _create_base_user(self, user_data: Dict[str, Any]) -> User:
+    @classmethod
+    def _validate(cls, user_data: Dict[str, Any]) -> None:
         """
-        Create the base User object with common fields
+        Check user_data before any database work starts
 
-        This method handles the creation of the core User model with
-        fields that are common to all user types.
+        Raises:
+            ValueError: If a required field is missing
         """
-        # Extract required fields
-        username = user_data.get("username")
-        email = user_data.get("email")
-        password = user_data.get("password")
-
-        if not all([username, email, password]):
+        if not all(
+            [user_data.get("username"), user_data.get("email"), user_data.get("password")]
+        ):
             raise ValueError("Username, email, and password are required")
 
-        # Create user with type-specific user_type
+    def _create_base_user(self, user_data: Dict[str, Any], **extra_fields) -> User:
+        """
+        Create the base User object with common fields
+
+        This method handles the creation of the core User model with
+        fields that are common to all user types. extra_fields (e.g. is_staff)
+        are written in the same INSERT.
+        """
+        # Required fields were checked by _validate before the transaction opened
         user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
+            username=user_data["username"],
+            email=user_data["email"],
+            password=user_data["password"],
             user_type=self.get_user_type(),
             first_name=user_data.get("first_name", ""),
             last_name=user_data.get("last_name", ""),
+            **extra_fields,
         )
 
         return user
 
-    def _setup_base_profiles(self, user: User) -> Dict[str, Any]:
+    def _setup_base_profiles(
+        self, user: User, user_data: Dict[str, Any], type_profile: Any = None
+    ) -> Dict[str, Any]:
         """
         Set up the base profiles that all users need
 
@@ -118,27 +153,150 @@ class AccountFactoryAbstract(ABC):
         - UserProfile (basic profile information)
         - UserPreferences (user settings)
         - UserAnalytics (tracking data)
+        - UserActivityCounters (hot activity counters)
         - UserBusinessInfo (business-related data)
+
+        Type-specific values are applied before the rows are inserted, so
+        no follow-up UPDATE is needed. The unsaved type_profile, if given, is
+        inserted in the same pass so all child writes happen back to back.
         """
-        profile_data = {}
+        profile_data = self._build_base_profiles(user, user_data)
+
+        rows = list(profile_data.values())
+        if type_profile is not None:
+            rows.append(type_profile)
 
-        # These are automatically created by Django signals, but we ensure they exist
-        profile_data["user_profile"] = user.profile
-        profile_data["user_preferences"] = user.preferences
-        profile_data["user_analytics"] = user.analytics
-        profile_data["user_business_info"] = user.business_info
+        # Building each row with user= already caches it on the matching
+        # reverse accessor (user.profile, ...), so nothing is re-fetched.
+        # Each row is a different model, so one INSERT per class
+        for obj in rows:
+            type(obj).objects.bulk_create([obj])
 
         return profile_data
 
+    def _build_base_profiles(
+        self, user: User, user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the unsaved base profile rows for a user
+
+        Uploaded images (profile_picture, store_logo) are never taken from
+        user_data; they are handled by a separate flow after signup, so account
+        creation does no file storage work.
+        """
+        return {
+            "user_profile": UserProfile(user=user),
+            "user_preferences": UserPreferences(
+                user=user, **self._get_preferences_settings(user_data)
+            ),
+            "user_analytics": UserAnalytics(user=user),
+            "user_activity_counters": UserActivityCounters(user=user),
+            "user_business_info": UserBusinessInfo(
+                user=user, **self._get_business_info_settings(user_data)
+            ),
+        }
+
+    def create_accounts(
+        self, users_data: List[Dict[str, Any]]
+    ) -> List[AccountCreationResult]:
+        """
+        Create many accounts of this type with one INSERT per table
+
+        Intended for seed data and imports: User rows, every base profile and
+        the type-specific profiles are each written with a single bulk_create.
+        Unlike create_account, errors are raised rather than collected.
+
+        Args:
+            users_data: List of user_data dictionaries (see create_account)
+
+        Returns:
+            List of AccountCreationResult, in input order
+
+        Raises:
+            ValueError: If any entry is missing a required field
+            IntegrityError: If a username or email is already taken
+        """
+        for user_data in users_data:
+            self._validate(user_data)
+
+        user_type = self.get_user_type()
+        users = []
+        for user_data in users_data:
+            user = User(
+                username=User.normalize_username(user_data["username"]),
+                email=User.objects.normalize_email(user_data["email"]),
+                user_type=user_type,
+                first_name=user_data.get("first_name", ""),
+                last_name=user_data.get("last_name", ""),
+                **self._get_user_extra_fields(user_data),
+            )
+            user.set_password(user_data["password"])
+            users.append(user)
+
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            if users and users[0].pk is None:
+                # Backends without INSERT ... RETURNING need one lookup for the pks
+                pks = dict(
+                    User.objects.filter(
+                        username__in=[user.username for user in users]
+                    ).values_list("username", "pk")
+                )
+                for user in users:
+                    user.pk = pks[user.username]
+
+            results = []
+            rows_by_model = defaultdict(list)
+            for user, user_data in zip(users, users_data):
+                profile_data = self._build_base_profiles(user, user_data)
+                type_profile = self._create_type_specific_profile(user, user_data)
+                for obj in (*profile_data.values(), type_profile):
+                    rows_by_model[type(obj)].append(obj)
+
+                profile_data[f"{user_type.value}_profile"] = type_profile
+                profile_data.update(
+                    self._configure_type_specific_settings(user, user_data)
+                )
+                results.append(AccountCreationResult(user, profile_data))
+
+            for model, rows in rows_by_model.items():
+                model.objects.bulk_create(rows)
+
+        return results
+
+    def _get_user_extra_fields(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return extra User field values (e.g. staff flags) for this user type"""
+        return {}
+
+    @staticmethod
+    def _apply_defaults(
+        defaults: Dict[str, Any], user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return defaults overlaid with the submitted values for the same keys"""
+        params = dict(defaults)
+        params.update((key, user_data[key]) for key in defaults.keys() & user_data.keys())
+        return params
+
+    def _get_preferences_settings(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the UserPreferences field values for this user type"""
+        return self._apply_defaults(self.PREFERENCES_DEFAULTS, user_data)
+
+    def _get_business_info_settings(
+        self, user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return the UserBusinessInfo field values for this user type"""
+        return {}
+
     @abstractmethod
     def _create_type_specific_profile(
         self, user: User, user_data: Dict[str, Any]
     ) -> Any:
         """
-        Create the type-specific profile for this user type
+        Build the type-specific profile for this user type
 
-        Each concrete factory must implement this to create the appropriate
-        profile type (BuyerProfile, SellerProfile, or AdminProfile).
+        Each concrete factory must implement this to build the appropriate
+        profile type (BuyerProfile, SellerProfile, or AdminProfile). The
+        instance is returned unsaved; _setup_base_profiles inserts it.
         """
         pass
 
@@ -165,10 +323,19 @@ class BuyerAccountFactory(AccountFactoryAbstract):
     - Buyer-specific business info setup
     """
 
-    def get_user_type(self) -> UserType:
-        return UserType.BUYER
+    USER_TYPE = UserType.BUYER
+    PROFILE_DEFAULTS = {
+        "preferred_shipping_method": "standard",
+        "newsletter_subscription": True,
+        "deal_notifications": True,
+        "product_recommendations": True,
+    }
+    PREFERENCES_DEFAULTS = {
+        "marketing_emails": True,
+        "newsletter_subscription": True,
+        "push_notifications": True,
+    }
 
-    @transaction.atomic
     def create_account(self, user_data: Dict[str, Any]) -> AccountCreationResult:
         """
         Create a complete buyer account
@@ -177,23 +344,25 @@ class BuyerAccountFactory(AccountFactoryAbstract):
         for a buyer account in a single database transaction.
         """
         try:
-            # Create base user
-            user = self._create_base_user(user_data)
+            # Invalid input fails here, before a transaction (and its locks) is opened
+            self._validate(user_data)
 
-            # Set up base profiles (automatically created by signals)
-            profile_data = self._setup_base_profiles(user)
+            with transaction.atomic():
+                # Create base user
+                user = self._create_base_user(user_data)
 
-            # Create buyer-specific profile
-            buyer_profile = self._create_type_specific_profile(user, user_data)
-            profile_data["buyer_profile"] = buyer_profile
+                # Build the buyer-specific profile, then insert it with the base profiles
+                buyer_profile = self._create_type_specific_profile(user, user_data)
+                profile_data = self._setup_base_profiles(user, user_data, buyer_profile)
+                profile_data["buyer_profile"] = buyer_profile
 
-            # Configure buyer-specific settings
-            settings_data = self._configure_type_specific_settings(user, user_data)
-            profile_data.update(settings_data)
+                # Configure buyer-specific settings
+                settings_data = self._configure_type_specific_settings(user, user_data)
+                profile_data.update(settings_data)
 
-            return AccountCreationResult(user, profile_data)
+                return AccountCreationResult(user, profile_data)
 
-        except Exception as e:
+        except (ValueError, IntegrityError) as e:
             result = AccountCreationResult(None, {})
             result.add_error(f"Failed to create buyer account: {str(e)}")
             return result
@@ -201,36 +370,23 @@ class BuyerAccountFactory(AccountFactoryAbstract):
     def _create_type_specific_profile(
         self, user: User, user_data: Dict[str, Any]
     ) -> BuyerProfile:
-        """Create and configure BuyerProfile"""
-        buyer_profile = BuyerProfile.objects.create(
-            user=user,
-            preferred_shipping_method=user_data.get(
-                "preferred_shipping_method", "standard"
-            ),
-            newsletter_subscription=user_data.get("newsletter_subscription", True),
-            deal_notifications=user_data.get("deal_notifications", True),
-            product_recommendations=user_data.get("product_recommendations", True),
+        """Build BuyerProfile"""
+        buyer_profile = BuyerProfile(
+            user=user, **self._apply_defaults(self.PROFILE_DEFAULTS, user_data)
         )
         return buyer_profile
 
+    def _get_business_info_settings(
+        self, user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Business info for buyers"""
+        return {"account_status": "active"}
+
     def _configure_type_specific_settings(
         self, user: User, user_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Configure buyer-specific settings"""
-        # Configure preferences for buyers
-        preferences = user.preferences
-        preferences.marketing_emails = user_data.get("marketing_emails", True)
-        preferences.newsletter_subscription = user_data.get(
-            "newsletter_subscription", True
-        )
-        preferences.push_notifications = user_data.get("push_notifications", True)
-        preferences.save()
-
-        # Configure business info for buyers
-        business_info = user.business_info
-        business_info.account_status = "active"
-        business_info.save()
-
+        # Preferences and business info were written in _setup_base_profiles
         return {
             "buyer_preferences_configured": True,
             "buyer_business_info_configured": True,
@@ -247,10 +403,22 @@ class SellerAccountFactory(AccountFactoryAbstract):
     - Seller-specific permissions and settings
     """
 
-    def get_user_type(self) -> UserType:
-        return UserType.SELLER
+    USER_TYPE = UserType.SELLER
+    PROFILE_DEFAULTS = {
+        "business_name": "",
+        "business_type": "individual",
+        "tax_id": "",
+        "business_address": "",
+        "store_name": "",
+        "store_description": "",
+        "commission_rate": 5.0,
+    }
+    PREFERENCES_DEFAULTS = {
+        "marketing_emails": False,  # Less marketing for sellers
+        "newsletter_subscription": False,
+        "push_notifications": True,
+    }
 
-    @transaction.atomic
     def create_account(self, user_data: Dict[str, Any]) -> AccountCreationResult:
         """
         Create a complete seller account
@@ -259,23 +427,25 @@ class SellerAccountFactory(AccountFactoryAbstract):
         for a seller account in a single database transaction.
         """
         try:
-            # Create base user
-            user = self._create_base_user(user_data)
+            # Invalid input fails here, before a transaction (and its locks) is opened
+            self._validate(user_data)
 
-            # Set up base profiles
-            profile_data = self._setup_base_profiles(user)
+            with transaction.atomic():
+                # Create base user
+                user = self._create_base_user(user_data)
 
-            # Create seller-specific profile
-            seller_profile = self._create_type_specific_profile(user, user_data)
-            profile_data["seller_profile"] = seller_profile
+                # Build the seller-specific profile, then insert it with the base profiles
+                seller_profile = self._create_type_specific_profile(user, user_data)
+                profile_data = self._setup_base_profiles(user, user_data, seller_profile)
+                profile_data["seller_profile"] = seller_profile
 
-            # Configure seller-specific settings
-            settings_data = self._configure_type_specific_settings(user, user_data)
-            profile_data.update(settings_data)
+                # Configure seller-specific settings
+                settings_data = self._configure_type_specific_settings(user, user_data)
+                profile_data.update(settings_data)
 
-            return AccountCreationResult(user, profile_data)
+                return AccountCreationResult(user, profile_data)
 
-        except Exception as e:
+        except (ValueError, IntegrityError) as e:
             result = AccountCreationResult(None, {})
             result.add_error(f"Failed to create seller account: {str(e)}")
             return result
@@ -283,39 +453,23 @@ class SellerAccountFactory(AccountFactoryAbstract):
     def _create_type_specific_profile(
         self, user: User, user_data: Dict[str, Any]
     ) -> SellerProfile:
-        """Create and configure SellerProfile"""
-        seller_profile = SellerProfile.objects.create(
-            user=user,
-            business_name=user_data.get("business_name", ""),
-            business_type=user_data.get("business_type", "individual"),
-            tax_id=user_data.get("tax_id", ""),
-            business_address=user_data.get("business_address", ""),
-            store_name=user_data.get("store_name", ""),
-            store_description=user_data.get("store_description", ""),
-            commission_rate=user_data.get("commission_rate", 5.0),
+        """Build SellerProfile"""
+        seller_profile = SellerProfile(
+            user=user, **self._apply_defaults(self.PROFILE_DEFAULTS, user_data)
         )
         return seller_profile
 
+    def _get_business_info_settings(
+        self, user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Business info for sellers"""
+        return {"account_status": "pending"}  # Sellers need verification
+
     def _configure_type_specific_settings(
         self, user: User, user_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Configure seller-specific settings"""
-        # Configure preferences for sellers
-        preferences = user.preferences
-        preferences.marketing_emails = user_data.get(
-            "marketing_emails", False
-        )  # Less marketing for sellers
-        preferences.newsletter_subscription = user_data.get(
-            "newsletter_subscription", False
-        )
-        preferences.push_notifications = user_data.get("push_notifications", True)
-        preferences.save()
-
-        # Configure business info for sellers
-        business_info = user.business_info
-        business_info.account_status = "pending"  # Sellers need verification
-        business_info.save()
-
+        # Preferences and business info were written in _setup_base_profiles
         return {
             "seller_preferences_configured": True,
             "seller_business_info_configured": True,
@@ -333,10 +487,25 @@ class AdminAccountFactory(AccountFactoryAbstract):
     - Admin-specific configurations
     """
 
-    def get_user_type(self) -> UserType:
-        return UserType.ADMIN
+    USER_TYPE = UserType.ADMIN
+    PROFILE_DEFAULTS = {
+        "admin_level": "junior",
+        "can_manage_users": False,
+        "can_manage_products": False,
+        "can_manage_orders": False,
+        "can_manage_payments": False,
+        "can_view_analytics": False,
+        "can_manage_system": False,
+        "department": "",
+        "role_description": "",
+        "require_2fa": True,
+        "session_timeout_minutes": 30,
+    }
+    PREFERENCES_DEFAULTS = {
+        "push_notifications": True,
+        "theme": "dark",  # Admins might prefer dark theme
+    }
 
-    @transaction.atomic
     def create_account(self, user_data: Dict[str, Any]) -> AccountCreationResult:
         """
         Create a complete admin account
@@ -345,28 +514,27 @@ class AdminAccountFactory(AccountFactoryAbstract):
         for an admin account in a single database transaction.
         """
         try:
-            # Create base user
-            user = self._create_base_user(user_data)
+            # Invalid input fails here, before a transaction (and its locks) is opened
+            self._validate(user_data)
 
-            # Set admin flags
-            user.is_staff = True
-            user.is_superuser = user_data.get("is_superuser", False)
-            user.save()
+            with transaction.atomic():
+                # Create base user with the admin flags in the same INSERT
+                user = self._create_base_user(
+                    user_data, **self._get_user_extra_fields(user_data)
+                )
 
-            # Set up base profiles
-            profile_data = self._setup_base_profiles(user)
+                # Build the admin-specific profile, then insert it with the base profiles
+                admin_profile = self._create_type_specific_profile(user, user_data)
+                profile_data = self._setup_base_profiles(user, user_data, admin_profile)
+                profile_data["admin_profile"] = admin_profile
 
-            # Create admin-specific profile
-            admin_profile = self._create_type_specific_profile(user, user_data)
-            profile_data["admin_profile"] = admin_profile
+                # Configure admin-specific settings
+                settings_data = self._configure_type_specific_settings(user, user_data)
+                profile_data.update(settings_data)
 
-            # Configure admin-specific settings
-            settings_data = self._configure_type_specific_settings(user, user_data)
-            profile_data.update(settings_data)
+                return AccountCreationResult(user, profile_data)
 
-            return AccountCreationResult(user, profile_data)
-
-        except Exception as e:
+        except (ValueError, IntegrityError) as e:
             result = AccountCreationResult(None, {})
             result.add_error(f"Failed to create admin account: {str(e)}")
             return result
@@ -374,43 +542,41 @@ class AdminAccountFactory(AccountFactoryAbstract):
     def _create_type_specific_profile(
         self, user: User, user_data: Dict[str, Any]
     ) -> AdminProfile:
-        """Create and configure AdminProfile"""
-        admin_profile = AdminProfile.objects.create(
-            user=user,
-            admin_level=user_data.get("admin_level", "junior"),
-            can_manage_users=user_data.get("can_manage_users", False),
-            can_manage_products=user_data.get("can_manage_products", False),
-            can_manage_orders=user_data.get("can_manage_orders", False),
-            can_manage_payments=user_data.get("can_manage_payments", False),
-            can_view_analytics=user_data.get("can_view_analytics", False),
-            can_manage_system=user_data.get("can_manage_system", False),
-            department=user_data.get("department", ""),
-            role_description=user_data.get("role_description", ""),
-            require_2fa=user_data.get("require_2fa", True),
-            session_timeout_minutes=user_data.get("session_timeout_minutes", 30),
+        """Build AdminProfile"""
+        admin_profile = AdminProfile(
+            user=user, **self._apply_defaults(self.PROFILE_DEFAULTS, user_data)
         )
         return admin_profile
 
+    def _get_user_extra_fields(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Staff flags for admins"""
+        return {
+            "is_staff": True,
+            "is_superuser": user_data.get("is_superuser", False),
+        }
+
+    def _get_preferences_settings(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Preferences for admins"""
+        settings = super()._get_preferences_settings(user_data)
+        # Admins don't need marketing emails, whatever was submitted
+        settings["marketing_emails"] = False
+        settings["newsletter_subscription"] = False
+        return settings
+
+    def _get_business_info_settings(
+        self, user_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Business info for admins"""
+        return {
+            "account_status": "active",
+            "is_premium": True,  # Admins get premium features
+        }
+
     def _configure_type_specific_settings(
         self, user: User, user_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Configure admin-specific settings"""
-        # Configure preferences for admins
-        preferences = user.preferences
-        preferences.marketing_emails = False  # Admins don't need marketing emails
-        preferences.newsletter_subscription = False
-        preferences.push_notifications = user_data.get("push_notifications", True)
-        preferences.theme = user_data.get(
-            "theme", "dark"
-        )  # Admins might prefer dark theme
-        preferences.save()
-
-        # Configure business info for admins
-        business_info = user.business_info
-        business_info.account_status = "active"
-        business_info.is_premium = True  # Admins get premium features
-        business_info.save()
-
+        # Preferences and business info were written in _setup_base_profiles
         return {
             "admin_preferences_configured": True,
             "admin_business_info_configured": True,
@@ -427,10 +593,11 @@ class AccountFactoryRegistry:
     make it easy to get the right factory for a given user type.
     """
 
+    # Factories hold no per-request state, so one shared instance per type is enough
     _factories = {
-        UserType.BUYER: BuyerAccountFactory,
-        UserType.SELLER: SellerAccountFactory,
-        UserType.ADMIN: AdminAccountFactory,
+        UserType.BUYER: BuyerAccountFactory(),
+        UserType.SELLER: SellerAccountFactory(),
+        UserType.ADMIN: AdminAccountFactory(),
     }
 
     @classmethod
@@ -447,11 +614,10 @@ class AccountFactoryRegistry:
         Raises:
             ValueError: If the user type is not supported
         """
-        if user_type not in cls._factories:
-            raise ValueError(f"Unsupported user type: {user_type}")
-
-        factory_class = cls._factories[user_type]
-        return factory_class()
+        try:
+            return cls._factories[user_type]
+        except KeyError:
+            raise ValueError(f"Unsupported user type: {user_type}") from None
 
     @classmethod
     def register_factory(cls, user_type: UserType, factory_class: type):
@@ -459,9 +625,37 @@ class AccountFactoryRegistry:
         Register a new factory for a user type
 
         This allows for extending the system with new user types
-        without modifying existing code.
+        without modifying existing code. The factory is instantiated once
+        here and shared by every get_factory() call.
+        """
+        factory = cls._factories[user_type] = factory_class()
+        _FACTORY_CREATE[user_type] = factory.create_account
+
+    @classmethod
+    def unregister_factory(cls, user_type: UserType):
+        """
+        Remove the factory registered for a user type
+
+        Raises:
+            ValueError: If no factory is registered for the user type
         """
-        cls._factories[user_type] = factory_class
+        try:
+            del cls._factories[user_type]
+        except KeyError:
+            raise ValueError(f"Unsupported user type: {user_type}") from None
+        del _FACTORY_CREATE[user_type]
+
+    @classmethod
+    def bulk_create(
+        cls, user_type: UserType, users_data: List[Dict[str, Any]]
+    ) -> List[AccountCreationResult]:
+        """
+        Create many accounts of one type in a single batch
+
+        Raises:
+            ValueError: If the user type is not supported or data is incomplete
+        """
+        return cls.get_factory(user_type).create_accounts(users_data)
 
     @classmethod
     def get_supported_user_types(cls) -> list:
@@ -469,6 +663,14 @@ class AccountFactoryRegistry:
         return list(cls._factories.keys())
 
 
+# Bound create_account methods keyed by user type; kept in step by
+# register_factory and unregister_factory
+_FACTORY_CREATE = {
+    user_type: factory.create_account
+    for user_type, factory in AccountFactoryRegistry._factories.items()
+}
+
+
 # Convenience function for creating accounts
 def create_account(
     user_type: UserType, user_data: Dict[str, Any]
@@ -503,5 +705,8 @@ def create_account(
         else:
             print(f"Account creation failed: {result.errors}")
     """
-    factory = AccountFactoryRegistry.get_factory(user_type)
-    return factory.create_account(user_data)
+    try:
+        create = _FACTORY_CREATE[user_type]
+    except KeyError:
+        raise ValueError(f"Unsupported user type: {user_type}") from None
+    return create(user_data)
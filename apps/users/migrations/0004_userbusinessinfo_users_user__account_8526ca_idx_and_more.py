@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_userbusinessinfo_referral_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userbusinessinfo',
+            index=models.Index(fields=['account_status'], name='users_user__account_8526ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['user', 'is_active', '-last_activity'], name='users_user__user_id_1d0873_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:33
+
+from django.db import migrations
+
+
+def copy_profile_names_to_user(apps, schema_editor):
+    """Keep any name that was only ever stored on the profile"""
+    UserProfile = apps.get_model("users", "UserProfile")
+    User = apps.get_model("users", "User")
+
+    profiles = (
+        UserProfile.objects.exclude(first_name="", last_name="")
+        .select_related("user")
+        .only("first_name", "last_name", "user__first_name", "user__last_name")
+    )
+    changed = []
+    for profile in profiles.iterator():
+        user = profile.user
+        copied = False
+        if profile.first_name and not user.first_name:
+            user.first_name = profile.first_name
+            copied = True
+        if profile.last_name and not user.last_name:
+            user.last_name = profile.last_name
+            copied = True
+        if copied:
+            changed.append(user)
+    User.objects.bulk_update(changed, ["first_name", "last_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_userbusinessinfo_users_user__account_8526ca_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_profile_names_to_user, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='first_name',
+        ),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='last_name',
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:34
+
+import apps.users.models
+from django.db import migrations, models
+
+
+def set_db_referral_code_default(apps, schema_editor):
+    """
+    Let PostgreSQL fill referral_code for rows inserted outside the ORM
+
+    gen_random_uuid() is built in from PostgreSQL 13, so no extension is needed.
+    Other backends rely on the model-level default only.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE users_user_business_info ALTER COLUMN referral_code "
+        "SET DEFAULT substr(replace(gen_random_uuid()::text, '-', ''), 1, 12)"
+    )
+
+
+def drop_db_referral_code_default(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE users_user_business_info ALTER COLUMN referral_code DROP DEFAULT"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_remove_userprofile_names'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userbusinessinfo',
+            name='referral_code',
+            field=models.CharField(blank=True, default=apps.users.models.generate_referral_code, max_length=20, null=True, unique=True),
+        ),
+        migrations.RunPython(set_db_referral_code_default, drop_db_referral_code_default),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_counters_from_analytics(apps, schema_editor):
+    """Move the existing counter values into the new table"""
+    UserAnalytics = apps.get_model("users", "UserAnalytics")
+    UserActivityCounters = apps.get_model("users", "UserActivityCounters")
+
+    rows = UserAnalytics.objects.values_list(
+        "user_id", "login_count", "total_sessions", "last_activity_date"
+    )
+    UserActivityCounters.objects.bulk_create(
+        (
+            UserActivityCounters(
+                user_id=user_id,
+                login_count=login_count,
+                total_sessions=total_sessions,
+                last_activity_date=last_activity_date,
+            )
+            for user_id, login_count, total_sessions, last_activity_date in rows.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+def copy_counters_to_analytics(apps, schema_editor):
+    """Put the counter values back into the re-added analytics columns"""
+    UserAnalytics = apps.get_model("users", "UserAnalytics")
+    UserActivityCounters = apps.get_model("users", "UserActivityCounters")
+
+    counters = {
+        user_id: (login_count, total_sessions, last_activity_date)
+        for user_id, login_count, total_sessions, last_activity_date in (
+            UserActivityCounters.objects.values_list(
+                "user_id", "login_count", "total_sessions", "last_activity_date"
+            ).iterator()
+        )
+    }
+    analytics = list(UserAnalytics.objects.filter(user_id__in=counters))
+    for row in analytics:
+        row.login_count, row.total_sessions, row.last_activity_date = counters[row.user_id]
+    UserAnalytics.objects.bulk_update(
+        analytics, ["login_count", "total_sessions", "last_activity_date"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_userbusinessinfo_referral_code_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityCounters',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('login_count', models.PositiveIntegerField(default=0)),
+                ('total_sessions', models.PositiveIntegerField(default=0)),
+                ('last_activity_date', models.DateTimeField(blank=True, null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='activity_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'users_user_activity_counters',
+            },
+        ),
+        migrations.RunPython(copy_counters_from_analytics, copy_counters_to_analytics),
+        migrations.RemoveField(
+            model_name='useranalytics',
+            name='last_activity_date',
+        ),
+        migrations.RemoveField(
+            model_name='useranalytics',
+            name='login_count',
+        ),
+        migrations.RemoveField(
+            model_name='useranalytics',
+            name='total_sessions',
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-14 04:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_useractivitycounters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersession',
+            name='session_key',
+            field=models.CharField(max_length=40),
+        ),
+        migrations.AddConstraint(
+            model_name='usersession',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('session_key',), name='uniq_active_session_key'),
+        ),
+    ]
@@ -1,7 +1,12 @@
+import secrets
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+
+
+def generate_referral_code():
+    """Return a random 12-character, URL-safe referral code"""
+    return secrets.token_urlsafe(9)
 
 
 class UserType(models.TextChoices):
@@ -57,9 +62,7 @@ class UserProfile(models.Model):
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
 
-    # Personal Information
-    first_name = models.CharField(max_length=150, blank=True)
-    last_name = models.CharField(max_length=150, blank=True)
+    # Personal Information (names live on User)
     date_of_birth = models.DateField(null=True, blank=True)
     bio = models.TextField(max_length=500, blank=True)
     profile_picture = models.ImageField(upload_to="profiles/", null=True, blank=True)
@@ -86,7 +89,7 @@ class UserProfile(models.Model):
     @property
     def full_name(self):
         """Get user's full name"""
-        return f"{self.first_name} {self.last_name}".strip()
+        return self.user.get_full_name()
 
     @property
     def has_complete_address(self):
@@ -160,6 +163,8 @@ class UserAnalytics(models.Model):
     - Login statistics
     - Profile metrics
     - Activity tracking
+
+    Counters bumped on every login/request live in UserActivityCounters.
     """
 
     user = models.OneToOneField(
@@ -167,7 +172,6 @@ class UserAnalytics(models.Model):
     )
 
     # Login Analytics
-    login_count = models.PositiveIntegerField(default=0)
     last_login_ip = models.GenericIPAddressField(null=True, blank=True)
     last_user_agent = models.TextField(blank=True)
 
@@ -176,11 +180,9 @@ class UserAnalytics(models.Model):
     profile_completion_score = models.FloatField(default=0.0)
 
     # Activity Analytics
-    total_sessions = models.PositiveIntegerField(default=0)
     average_session_duration = models.DurationField(null=True, blank=True)
 
     # Engagement Analytics
-    last_activity_date = models.DateTimeField(null=True, blank=True)
     days_since_registration = models.PositiveIntegerField(default=0)
 
     # Metadata
@@ -194,6 +196,29 @@ class UserAnalytics(models.Model):
         return f"Analytics of {self.user.username}"
 
 
+class UserActivityCounters(models.Model):
+    """
+    Hot activity counters split out of UserAnalytics
+
+    Responsibility: Frequently incremented activity counters
+    - Kept to a narrow row so each increment rewrites only these columns
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, related_name="activity_counters"
+    )
+
+    login_count = models.PositiveIntegerField(default=0)
+    total_sessions = models.PositiveIntegerField(default=0)
+    last_activity_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "users_user_activity_counters"
+
+    def __str__(self):
+        return f"Activity counters of {self.user.username}"
+
+
 class UserBusinessInfo(models.Model):
     """
     GOOD EXAMPLE: Separate model for Business Logic
@@ -223,7 +248,9 @@ class UserBusinessInfo(models.Model):
     total_spent = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 
     # Referral System
-    referral_code = models.CharField(max_length=20, unique=True, blank=True, null=True)
+    referral_code = models.CharField(
+        max_length=20, unique=True, blank=True, null=True, default=generate_referral_code
+    )
     referred_by = models.ForeignKey(
         User, null=True, blank=True, on_delete=models.SET_NULL, related_name="referrals"
     )
@@ -247,6 +274,10 @@ class UserBusinessInfo(models.Model):
 
     class Meta:
         db_table = "users_user_business_info"
+        # referral_code (unique) and referred_by (FK) are already indexed
+        indexes = [
+            models.Index(fields=["account_status"]),
+        ]
 
     def __str__(self):
         return f"Business Info of {self.user.username}"
@@ -263,7 +294,7 @@ class UserSession(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="sessions")
 
-    session_key = models.CharField(max_length=40, unique=True)
+    session_key = models.CharField(max_length=40)
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField()
 
@@ -275,48 +306,23 @@ class UserSession(models.Model):
     class Meta:
         db_table = "users_user_session"
         ordering = ["-last_activity"]
+        indexes = [
+            # A user's active sessions, newest first (also serves user + is_active)
+            models.Index(fields=["user", "is_active", "-last_activity"]),
+        ]
+        constraints = [
+            # Only live sessions need unique keys; expired rows stay out of the index
+            models.UniqueConstraint(
+                fields=["session_key"],
+                condition=models.Q(is_active=True),
+                name="uniq_active_session_key",
+            ),
+        ]
 
     def __str__(self):
         return f"Session {self.session_key} for {self.user.username}"
 
 
-# GOOD EXAMPLE: Using Django signals to auto-create related models
-@receiver(post_save, sender=User)
-def create_user_related_models(sender, instance, created, **kwargs):
-    """
-    Automatically create related models when a User is created
-
-    This ensures every User has all related models without
-    cluttering the User model with this logic
-    """
-    if created:
-        UserProfile.objects.get_or_create(user=instance)
-        UserPreferences.objects.get_or_create(user=instance)
-        UserAnalytics.objects.get_or_create(user=instance)
-        UserBusinessInfo.objects.get_or_create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_related_models(sender, instance, **kwargs):
-    """
-    Save related models when User is saved
-
-    Ensures related models exist and are saved properly
-    """
-    # Get or create related models if they don't exist
-    if hasattr(instance, "profile"):
-        instance.profile.save()
-
-    if hasattr(instance, "preferences"):
-        instance.preferences.save()
-
-    if hasattr(instance, "analytics"):
-        instance.analytics.save()
-
-    if hasattr(instance, "business_info"):
-        instance.business_info.save()
-
-
 class BuyerProfile(models.Model):
     """
     Buyer-specific profile information
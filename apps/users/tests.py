@@ -6,8 +6,13 @@ for user account creation, ensuring that all user types are created
 correctly with their associated profiles and configurations.
 """
 
-from django.test import TestCase, TransactionTestCase
-from django.contrib.auth import get_user_model
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.auth import get_user, get_user_model
+from django.contrib.messages import get_messages
+from django.http import HttpResponseRedirect
+from django.urls import reverse
 from django.db import transaction
 from django.core.exceptions import ValidationError
 
@@ -30,11 +35,25 @@ from .factories import (
     create_account,
     AccountCreationResult,
 )
+from . import views
 
 User = get_user_model()
 
+# Every test account gets a password; PBKDF2 would dominate the suite's runtime
+_fast_password_hashing = override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+
+
+def setUpModule():
+    _fast_password_hashing.enable()
+
+
+def tearDownModule():
+    _fast_password_hashing.disable()
+
 
-class AccountCreationResultTest(TestCase):
+class AccountCreationResultTest(SimpleTestCase):
     """Test the AccountCreationResult class"""
 
     def test_successful_result(self):
@@ -58,13 +77,14 @@ class AccountCreationResultTest(TestCase):
         self.assertFalse(result.success)
 
 
-class BuyerAccountFactoryTest(TransactionTestCase):
+class BuyerAccountFactoryTest(TestCase):
     """Test the BuyerAccountFactory"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.factory = BuyerAccountFactory()
-        self.user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the shared factory, user data template and created account"""
+        cls.factory = BuyerAccountFactory()
+        cls.user_data_template = {
             "username": "test_buyer",
             "email": "buyer@example.com",
             "password": "test_password_123",
@@ -75,6 +95,7 @@ class BuyerAccountFactoryTest(TransactionTestCase):
             "deal_notifications": True,
             "product_recommendations": False,
         }
+        cls.result = cls.factory.create_account(cls.user_data_template)
 
     def test_get_user_type(self):
         """Test that factory returns correct user type"""
@@ -82,7 +103,7 @@ class BuyerAccountFactoryTest(TransactionTestCase):
 
     def test_create_buyer_account_success(self):
         """Test successful buyer account creation"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         self.assertTrue(result.is_successful)
         self.assertIsNotNone(result.user)
@@ -120,9 +141,21 @@ class BuyerAccountFactoryTest(TransactionTestCase):
         self.assertIsNone(result.user)
         self.assertTrue(len(result.errors) > 0)
 
+    def test_related_profiles_are_cached(self):
+        """Test that the returned user serves its child rows without queries"""
+        result = self.result
+
+        with self.assertNumQueries(0):
+            result.user.profile
+            result.user.preferences
+            result.user.analytics
+            result.user.activity_counters
+            result.user.business_info
+            result.user.buyer_profile
+
     def test_buyer_preferences_configuration(self):
         """Test that buyer preferences are configured correctly"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         preferences = result.user.preferences
         self.assertTrue(preferences.marketing_emails)
@@ -133,13 +166,14 @@ class BuyerAccountFactoryTest(TransactionTestCase):
         self.assertEqual(business_info.account_status, "active")
 
 
-class SellerAccountFactoryTest(TransactionTestCase):
+class SellerAccountFactoryTest(TestCase):
     """Test the SellerAccountFactory"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.factory = SellerAccountFactory()
-        self.user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the shared factory, user data template and created account"""
+        cls.factory = SellerAccountFactory()
+        cls.user_data_template = {
             "username": "test_seller",
             "email": "seller@example.com",
             "password": "test_password_123",
@@ -153,6 +187,7 @@ class SellerAccountFactoryTest(TransactionTestCase):
             "store_description": "A test store for testing purposes",
             "commission_rate": 3.5,
         }
+        cls.result = cls.factory.create_account(cls.user_data_template)
 
     def test_get_user_type(self):
         """Test that factory returns correct user type"""
@@ -160,7 +195,7 @@ class SellerAccountFactoryTest(TransactionTestCase):
 
     def test_create_seller_account_success(self):
         """Test successful seller account creation"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         self.assertTrue(result.is_successful)
         self.assertIsNotNone(result.user)
@@ -190,7 +225,7 @@ class SellerAccountFactoryTest(TransactionTestCase):
 
     def test_seller_preferences_configuration(self):
         """Test that seller preferences are configured correctly"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         preferences = result.user.preferences
         self.assertFalse(preferences.marketing_emails)  # Less marketing for sellers
@@ -201,13 +236,14 @@ class SellerAccountFactoryTest(TransactionTestCase):
         self.assertEqual(business_info.account_status, "pending")  # Needs verification
 
 
-class AdminAccountFactoryTest(TransactionTestCase):
+class AdminAccountFactoryTest(TestCase):
     """Test the AdminAccountFactory"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.factory = AdminAccountFactory()
-        self.user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the shared factory, user data template and created account"""
+        cls.factory = AdminAccountFactory()
+        cls.user_data_template = {
             "username": "test_admin",
             "email": "admin@example.com",
             "password": "test_password_123",
@@ -222,6 +258,7 @@ class AdminAccountFactoryTest(TransactionTestCase):
             "require_2fa": True,
             "session_timeout_minutes": 15,
         }
+        cls.result = cls.factory.create_account(cls.user_data_template)
 
     def test_get_user_type(self):
         """Test that factory returns correct user type"""
@@ -229,7 +266,7 @@ class AdminAccountFactoryTest(TransactionTestCase):
 
     def test_create_admin_account_success(self):
         """Test successful admin account creation"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         self.assertTrue(result.is_successful)
         self.assertIsNotNone(result.user)
@@ -265,8 +302,13 @@ class AdminAccountFactoryTest(TransactionTestCase):
 
     def test_create_superuser_admin(self):
         """Test creating an admin with superuser privileges"""
-        self.user_data["is_superuser"] = True
-        result = self.factory.create_account(self.user_data)
+        user_data = {
+            **self.user_data_template,
+            "username": "test_superuser",
+            "email": "superuser@example.com",
+            "is_superuser": True,
+        }
+        result = self.factory.create_account(user_data)
 
         self.assertTrue(result.is_successful)
         self.assertTrue(result.user.is_superuser)
@@ -274,7 +316,7 @@ class AdminAccountFactoryTest(TransactionTestCase):
 
     def test_admin_preferences_configuration(self):
         """Test that admin preferences are configured correctly"""
-        result = self.factory.create_account(self.user_data)
+        result = self.result
 
         preferences = result.user.preferences
         self.assertFalse(preferences.marketing_emails)  # Admins don't need marketing
@@ -287,7 +329,7 @@ class AdminAccountFactoryTest(TransactionTestCase):
         self.assertTrue(business_info.is_premium)  # Admins get premium features
 
 
-class AccountFactoryRegistryTest(TestCase):
+class AccountFactoryRegistryTest(SimpleTestCase):
     """Test the AccountFactoryRegistry"""
 
     def test_get_factory_buyer(self):
@@ -340,12 +382,23 @@ class AccountFactoryRegistryTest(TestCase):
         # Test that it can be retrieved
         factory = AccountFactoryRegistry.get_factory("test")
         self.assertIsInstance(factory, TestFactory)
+        self.assertIsNone(create_account("test", {}))
 
         # Clean up
-        del AccountFactoryRegistry._factories["test"]
+        AccountFactoryRegistry.unregister_factory("test")
+        with self.assertRaises(ValueError):
+            AccountFactoryRegistry.get_factory("test")
+        with self.assertRaises(ValueError):
+            create_account("test", {})
+
+    def test_unregister_unknown_factory(self):
+        """Test unregistering a user type that has no factory"""
+        with self.assertRaises(ValueError):
+            AccountFactoryRegistry.unregister_factory("invalid_type")
+        self.assertEqual(len(AccountFactoryRegistry.get_supported_user_types()), 3)
 
 
-class ConvenienceFunctionTest(TransactionTestCase):
+class ConvenienceFunctionTest(TestCase):
     """Test the convenience create_account function"""
 
     def test_create_buyer_account(self):
@@ -398,21 +451,77 @@ class ConvenienceFunctionTest(TransactionTestCase):
         self.assertTrue(result.user.is_staff)
 
 
-class DatabaseIntegrityTest(TransactionTestCase):
+class BulkAccountCreationTest(TestCase):
+    """Test creating many accounts in one batch"""
+
+    def test_bulk_create_sellers(self):
+        """Test that every user gets its base and seller profiles"""
+        users_data = [
+            {
+                "username": f"bulk_seller_{i}",
+                "email": f"bulk_seller_{i}@example.com",
+                "password": "test_password_123",
+                "store_name": f"Store {i}",
+            }
+            for i in range(3)
+        ]
+
+        results = AccountFactoryRegistry.bulk_create(UserType.SELLER, users_data)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(User.objects.filter(user_type=UserType.SELLER).count(), 3)
+        for i, result in enumerate(results):
+            self.assertTrue(result.is_successful)
+            user = User.objects.get(username=f"bulk_seller_{i}")
+            self.assertTrue(user.check_password("test_password_123"))
+            self.assertEqual(user.seller_profile.store_name, f"Store {i}")
+            self.assertEqual(user.business_info.account_status, "pending")
+            self.assertFalse(user.preferences.marketing_emails)
+            self.assertTrue(hasattr(user, "profile"))
+            self.assertTrue(hasattr(user, "analytics"))
+
+    def test_bulk_create_admins_sets_staff(self):
+        """Test that admin flags are applied in the batch path"""
+        results = AccountFactoryRegistry.bulk_create(
+            UserType.ADMIN,
+            [
+                {
+                    "username": "bulk_admin",
+                    "email": "bulk_admin@example.com",
+                    "password": "test_password_123",
+                }
+            ],
+        )
+
+        self.assertTrue(results[0].user.is_staff)
+        self.assertTrue(User.objects.get(username="bulk_admin").is_staff)
+
+    def test_bulk_create_missing_fields(self):
+        """Test that incomplete data is rejected before anything is written"""
+        with self.assertRaises(ValueError):
+            AccountFactoryRegistry.bulk_create(
+                UserType.BUYER, [{"username": "bulk_incomplete"}]
+            )
+
+        self.assertFalse(User.objects.filter(username="bulk_incomplete").exists())
+
+
+class DatabaseIntegrityTest(TestCase):
     """Test database integrity and constraints"""
 
     def test_user_type_choices(self):
         """Test that user_type field accepts valid choices"""
         for user_type in [UserType.BUYER, UserType.SELLER, UserType.ADMIN]:
-            user_data = {
-                "username": f"test_{user_type.value}",
-                "email": f"{user_type.value}@example.com",
-                "password": "test_password_123",
-            }
+            with self.subTest(user_type=user_type):
+                user_data = {
+                    "username": f"test_{user_type.value}",
+                    "email": f"{user_type.value}@example.com",
+                    "password": "test_password_123",
+                }
 
-            result = create_account(user_type, user_data)
-            self.assertTrue(result.is_successful)
-            self.assertEqual(result.user.user_type, user_type)
+                result = create_account(user_type, user_data)
+                self.assertTrue(result.is_successful)
+                self.assertEqual(result.user.user_type, user_type)
 
     def test_unique_email_constraint(self):
         """Test that email uniqueness is enforced"""
@@ -453,7 +562,7 @@ class DatabaseIntegrityTest(TransactionTestCase):
         self.assertEqual(user.profile.user.buyer_profile, user.buyer_profile)
 
 
-class FactoryPatternBenefitsTest(TransactionTestCase):
+class FactoryPatternBenefitsTest(TestCase):
     """Test that demonstrates the benefits of the Factory Pattern"""
 
     def test_consistent_account_creation(self):
@@ -471,32 +580,35 @@ class FactoryPatternBenefitsTest(TransactionTestCase):
         ]
 
         for user_type, username, email in test_cases:
-            user_data = {
-                **base_data,
-                "username": username,
-                "email": email,
-            }
-
-            result = create_account(user_type, user_data)
-
-            # All account types should be created successfully
-            self.assertTrue(
-                result.is_successful, f"Failed to create {user_type} account"
-            )
-
-            # All should have base profiles
-            self.assertTrue(hasattr(result.user, "profile"))
-            self.assertTrue(hasattr(result.user, "preferences"))
-            self.assertTrue(hasattr(result.user, "analytics"))
-            self.assertTrue(hasattr(result.user, "business_info"))
-
-            # Each should have their specific profile
-            if user_type == UserType.BUYER:
-                self.assertTrue(hasattr(result.user, "buyer_profile"))
-            elif user_type == UserType.SELLER:
-                self.assertTrue(hasattr(result.user, "seller_profile"))
-            elif user_type == UserType.ADMIN:
-                self.assertTrue(hasattr(result.user, "admin_profile"))
+            with self.subTest(user_type=user_type):
+                user_data = {
+                    **base_data,
+                    "username": username,
+                    "email": email,
+                }
+
+                result = create_account(user_type, user_data)
+
+                # All account types should be created successfully
+                self.assertTrue(
+                    result.is_successful, f"Failed to create {user_type} account"
+                )
+
+                # The factory caches every created row, so probing is query-free
+                with self.assertNumQueries(0):
+                    # All should have base profiles
+                    self.assertTrue(hasattr(result.user, "profile"))
+                    self.assertTrue(hasattr(result.user, "preferences"))
+                    self.assertTrue(hasattr(result.user, "analytics"))
+                    self.assertTrue(hasattr(result.user, "business_info"))
+
+                    # Each should have their specific profile
+                    if user_type == UserType.BUYER:
+                        self.assertTrue(hasattr(result.user, "buyer_profile"))
+                    elif user_type == UserType.SELLER:
+                        self.assertTrue(hasattr(result.user, "seller_profile"))
+                    elif user_type == UserType.ADMIN:
+                        self.assertTrue(hasattr(result.user, "admin_profile"))
 
     def test_extensibility(self):
         """Test that the pattern is easily extensible"""
@@ -515,6 +627,28 @@ class FactoryPatternBenefitsTest(TransactionTestCase):
 
         # The existing code wouldn't need to change at all!
 
+    def test_factory_overriding_get_user_type(self):
+        """Test that a factory naming its type in get_user_type() creates that type"""
+
+        class LegacyBuyerFactory(BuyerAccountFactory):
+            USER_TYPE = None
+
+            def get_user_type(self):
+                return UserType.BUYER
+
+        factory = LegacyBuyerFactory()
+        result = factory.create_account(
+            {"username": "legacy", "email": "legacy@example.com", "password": "pw"}
+        )
+        [bulk_result] = factory.create_accounts(
+            [{"username": "legacy_bulk", "email": "legacy_bulk@example.com", "password": "pw"}]
+        )
+
+        self.assertTrue(result.is_successful)
+        self.assertEqual(result.user.user_type, UserType.BUYER)
+        self.assertEqual(bulk_result.user.user_type, UserType.BUYER)
+        self.assertIn("buyer_profile", bulk_result.profile_data)
+
     def test_encapsulation_of_complexity(self):
         """Test that complex creation logic is properly encapsulated"""
         # The factory pattern hides the complexity of creating multiple
@@ -543,3 +677,93 @@ class FactoryPatternBenefitsTest(TransactionTestCase):
         self.assertTrue(hasattr(result.user, "seller_profile"))
 
         # All this complexity is handled by the factory, not the client code!
+
+
+class UserRegistrationViewTest(TestCase):
+    """Test account creation through UserRegistrationView"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            username="root", email="root@example.com", password="root_password"
+        )
+
+    def _register(self, user_type, username="new_user"):
+        """Post the registration form; returns (response, the mocked redirect)"""
+        data = {
+            "user_type": user_type,
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "test_password_123",
+        }
+        # The dashboard URL names are not routed in this project, so capture
+        # the redirect target instead of reversing it
+        with mock.patch.object(
+            views, "redirect", side_effect=lambda to: HttpResponseRedirect(f"/{to}/")
+        ) as redirect:
+            response = self.client.post(reverse("users:register"), data)
+        return response, redirect
+
+    @staticmethod
+    def _messages(response):
+        return [str(message) for message in get_messages(response.wsgi_request)]
+
+    def test_redirect_per_user_type(self):
+        """Test that each user type is created and sent to its own landing page"""
+        for user_type in (UserType.BUYER, UserType.SELLER, UserType.ADMIN):
+            with self.subTest(user_type=user_type):
+                if user_type in views.SUPERUSER_ONLY_TYPES:
+                    self.client.force_login(self.superuser)
+                username = f"new_{user_type.value}"
+
+                response, redirect = self._register(user_type.value, username)
+
+                redirect.assert_called_once_with(views.REGISTRATION_REDIRECTS[user_type])
+                self.assertEqual(response.status_code, 302)
+                user = User.objects.get(username=username)
+                self.assertEqual(user.user_type, user_type)
+                self.client.logout()
+
+    def test_registered_user_is_logged_in(self):
+        """Test that the session is authenticated as the new user with ModelBackend"""
+        response, redirect = self._register(UserType.BUYER.value)
+
+        user = User.objects.get(username="new_user")
+        self.assertEqual(get_user(self.client), user)
+        self.assertEqual(
+            self.client.session["_auth_user_backend"],
+            "django.contrib.auth.backends.ModelBackend",
+        )
+        self.assertIn(
+            "Buyer account created successfully! Welcome, new_user!",
+            self._messages(response),
+        )
+
+    def test_admin_registration_requires_superuser(self):
+        """Test that only a superuser may create admin accounts"""
+        buyer = create_account(
+            UserType.BUYER,
+            {"username": "buyer", "email": "buyer@example.com", "password": "pw"},
+        ).user
+        for user in (None, buyer):
+            with self.subTest(user=user):
+                if user is not None:
+                    self.client.force_login(user)
+
+                response, redirect = self._register(UserType.ADMIN.value)
+
+                redirect.assert_called_once_with("users:register")
+                self.assertIn(
+                    "You do not have permission to create admin accounts.",
+                    self._messages(response),
+                )
+                self.assertFalse(User.objects.filter(username="new_user").exists())
+
+    def test_invalid_user_type(self):
+        """Test that an unknown user type is rejected before any account is created"""
+        response, redirect = self._register("wizard")
+
+        redirect.assert_called_once_with("users:register")
+        self.assertIn("Invalid user type: wizard", self._messages(response))
+        self.assertFalse(User.objects.filter(username="new_user").exists())
+        self.assertNotIn("_auth_user_id", self.client.session)
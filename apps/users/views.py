@@ -7,7 +7,7 @@ consistent interfaces for creating different types of user accounts.
 """
 
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, authenticate
+from django.contrib.auth import login
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -20,6 +20,53 @@ import json
 from .models import UserType
 from .factories import create_account, AccountFactoryRegistry
 
+_USER_TYPE_LOOKUP = {user_type.value: user_type for user_type in UserType}
+
+# Type-specific text fields and their defaults, read straight from the form
+USER_TYPE_FIELDS = {
+    UserType.BUYER: (("preferred_shipping_method", "standard"),),
+    UserType.SELLER: (
+        ("business_name", ""),
+        ("business_type", "individual"),
+        ("tax_id", ""),
+        ("business_address", ""),
+        ("store_name", ""),
+        ("store_description", ""),
+    ),
+    UserType.ADMIN: (
+        ("admin_level", "junior"),
+        ("department", ""),
+        ("role_description", ""),
+    ),
+}
+
+# Type-specific checkbox fields; a ticked box posts "on"
+USER_TYPE_FLAGS = {
+    UserType.BUYER: (
+        "newsletter_subscription",
+        "deal_notifications",
+        "product_recommendations",
+    ),
+    UserType.SELLER: (),
+    UserType.ADMIN: (
+        "can_manage_users",
+        "can_manage_products",
+        "can_manage_orders",
+        "can_manage_payments",
+        "can_view_analytics",
+        "can_manage_system",
+    ),
+}
+
+# Account types only a superuser may create
+SUPERUSER_ONLY_TYPES = frozenset({UserType.ADMIN})
+
+REGISTRATION_REDIRECTS = {
+    UserType.BUYER: "users:buyer_dashboard",
+    UserType.SELLER: "users:seller_dashboard",
+    UserType.ADMIN: "admin:index",
+}
+
 
 class UserRegistrationView(View):
     """
@@ -40,107 +87,54 @@ class UserRegistrationView(View):
     def post(self, request):
         """Handle user registration using factory pattern"""
         try:
+            form = request.POST
+
             # Extract user type from form data
-            user_type_str = request.POST.get("user_type", UserType.BUYER)
-            user_type = UserType(user_type_str)
+            user_type_str = form.get("user_type", UserType.BUYER)
+            user_type = _USER_TYPE_LOOKUP.get(user_type_str)
+            if user_type is None:
+                messages.error(request, f"Invalid user type: {user_type_str}")
+                return redirect("users:register")
 
             # Prepare user data from form
             user_data = {
-                "username": request.POST.get("username"),
-                "email": request.POST.get("email"),
-                "password": request.POST.get("password"),
-                "first_name": request.POST.get("first_name", ""),
-                "last_name": request.POST.get("last_name", ""),
+                "username": form.get("username"),
+                "email": form.get("email"),
+                "password": form.get("password"),
+                "first_name": form.get("first_name", ""),
+                "last_name": form.get("last_name", ""),
             }
 
-            # Add type-specific data based on user type
-            if user_type == UserType.BUYER:
-                user_data.update(
-                    {
-                        "preferred_shipping_method": request.POST.get(
-                            "preferred_shipping_method", "standard"
-                        ),
-                        "newsletter_subscription": request.POST.get(
-                            "newsletter_subscription"
-                        )
-                        == "on",
-                        "deal_notifications": request.POST.get("deal_notifications")
-                        == "on",
-                        "product_recommendations": request.POST.get(
-                            "product_recommendations"
-                        )
-                        == "on",
-                    }
-                )
-            elif user_type == UserType.SELLER:
-                user_data.update(
-                    {
-                        "business_name": request.POST.get("business_name", ""),
-                        "business_type": request.POST.get(
-                            "business_type", "individual"
-                        ),
-                        "tax_id": request.POST.get("tax_id", ""),
-                        "business_address": request.POST.get("business_address", ""),
-                        "store_name": request.POST.get("store_name", ""),
-                        "store_description": request.POST.get("store_description", ""),
-                    }
-                )
-            elif user_type == UserType.ADMIN:
-                # Admin creation might be restricted to superusers
-                if not request.user.is_superuser:
-                    messages.error(
-                        request, "You do not have permission to create admin accounts."
-                    )
-                    return redirect("users:register")
-
-                user_data.update(
-                    {
-                        "admin_level": request.POST.get("admin_level", "junior"),
-                        "department": request.POST.get("department", ""),
-                        "role_description": request.POST.get("role_description", ""),
-                        "can_manage_users": request.POST.get("can_manage_users")
-                        == "on",
-                        "can_manage_products": request.POST.get("can_manage_products")
-                        == "on",
-                        "can_manage_orders": request.POST.get("can_manage_orders")
-                        == "on",
-                        "can_manage_payments": request.POST.get("can_manage_payments")
-                        == "on",
-                        "can_view_analytics": request.POST.get("can_view_analytics")
-                        == "on",
-                        "can_manage_system": request.POST.get("can_manage_system")
-                        == "on",
-                    }
+            # Admin creation might be restricted to superusers
+            if user_type in SUPERUSER_ONLY_TYPES and not request.user.is_superuser:
+                messages.error(
+                    request, "You do not have permission to create admin accounts."
                 )
+                return redirect("users:register")
+
+            # Add type-specific data based on user type
+            for field, default in USER_TYPE_FIELDS[user_type]:
+                user_data[field] = form.get(field, default)
+            for field in USER_TYPE_FLAGS[user_type]:
+                user_data[field] = form.get(field) == "on"
 
             # Use factory pattern to create account
             result = create_account(user_type, user_data)
 
             if result.is_successful:
-                # Log the user in
-                user = authenticate(
-                    request, username=user_data["email"], password=user_data["password"]
+                # Log the user in; the account was just created with this
+                # password, so there is nothing for authenticate() to verify
+                user = result.user
+                login(
+                    request, user, backend="django.contrib.auth.backends.ModelBackend"
                 )
-                if user:
-                    login(request, user)
-                    messages.success(
-                        request,
-                        f"{user_type.label} account created successfully! Welcome, {user.username}!",
-                    )
-
-                    # Redirect based on user type
-                    if user_type == UserType.BUYER:
-                        return redirect("users:buyer_dashboard")
-                    elif user_type == UserType.SELLER:
-                        return redirect("users:seller_dashboard")
-                    elif user_type == UserType.ADMIN:
-                        return redirect("admin:index")
-                else:
-                    messages.error(
-                        request,
-                        "Account created but login failed. Please try logging in manually.",
-                    )
-                    return redirect("users:login")
+                messages.success(
+                    request,
+                    f"{user_type.label} account created successfully! Welcome, {user.username}!",
+                )
+
+                # Redirect based on user type
+                return redirect(REGISTRATION_REDIRECTS[user_type])
             else:
                 # Handle creation errors
                 for error in result.errors:
@@ -148,12 +142,9 @@ class UserRegistrationView(View):
                 return render(
                     request,
                     "users/register.html",
-                    {"user_types": UserType.choices, "form_data": request.POST},
+                    {"user_types": UserType.choices, "form_data": form},
                 )
 
-        except ValueError as e:
-            messages.error(request, f"Invalid user type: {e}")
-            return redirect("users:register")
         except Exception as e:
             messages.error(request, f"Registration failed: {e}")
             return redirect("users:register")
@@ -45,10 +45,13 @@ DJANGO_APPS = [
 
 THIRD_PARTY_APPS = [
     'django_redis',
+    'django_ratelimit',
 ]
 
 LOCAL_APPS = [
     'apps.users',
+    'apps.payments',
+    'apps.products',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -61,6 +64,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'django_ratelimit.middleware.RatelimitMiddleware',
 ]
 
 ROOT_URLCONF = 'marketplace.urls'
@@ -145,10 +149,15 @@ CACHES = {
         'LOCATION': config('REDIS_URL', default='redis://127.0.0.1:6379/1'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 50},
         }
     }
 }
 
+# Rate limiting (counters live in Redis so they are shared across workers)
+RATELIMIT_USE_CACHE = 'default'
+RATELIMIT_VIEW = 'apps.payments.views.ratelimited'
+
 # Session Configuration
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'